@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, Tuple
 
 # Time limits (in seconds)
 MINUTE: int = 60
@@ -7,16 +7,34 @@ DAY: int = 24 * HOUR
 ADMIN_SESSION_COOKIE_AGE: int = 3 * DAY
 USER_SESSION_FULL_AGE: int = 30 * DAY
 USER_SESSION_RENEWAL_AGE: int = 3 * DAY
+USER_SESSION_REFRESH_THRESHOLD: int = 2 * DAY
 VERIFICATION_CODE_CACHE_AGE: int = 5 * MINUTE
 WORKER_WAIT: int = HOUR
 UNSUCCESSFUL_LOGIN_COUNT_CACHE_AGE: int = 4 * HOUR
+USER_SNAPSHOT_CACHE_AGE: int = HOUR
+USER_SNAPSHOT_LOCAL_CACHE_AGE: int = 5
+ZSTD_DICTIONARY_REFRESH_AGE: int = 5 * MINUTE
 
 # Cache key prefixes for Redis
 USER_SESSION_KEY_PREFIX: str = ":2:user-auth-token-"
+USER_SNAPSHOT_KEY_PREFIX: str = ":2:user-snapshot-"
+USER_SNAPSHOT_GENERATION_PREFIX: str = ":2:user-generation-"
 VERIFICATION_CODE_CACHE_PREFIX: str = ":3:vcode-"
-UNSUCCESSFUL_LOGIN_COUNT_CACHE_PREFIX: str = ":3:unsuccessful-login-"
+UNSUCCESSFUL_LOGIN_COUNT_CACHE_PREFIX: str = ":3:unsuccessful-login-count-"
+ZSTD_DICTIONARY_KEY_PREFIX: str = ":4:zstd-dictionary-"  # Outside The ":1:" Cache
+ZSTD_DICTIONARY_ACTIVE_KEY: str = ":4:zstd-dictionary-active"
 GET_QUERY_FILTER_SEARCH_PREFIX: str = "filter__"
 
+# Redis storage configuration
+REDIS_BATCH_SIZE: int = 100
+REDIS_COMPRESS_MIN_SIZE: int = 256
+ZSTD_DICTIONARY_SIZE: int = 4 * 1024
+ZSTD_DICTIONARY_SAMPLES: int = 5000
+
+# Encrypted field blind index (version 1: SHA-256 hex, version 2: keyed BLAKE2b)
+BLIND_INDEX_DIGEST_SIZE: int = 16  # Bytes (Stored As 32 Hex Characters)
+BLIND_INDEX_BATCH_SIZE: int = 500
+
 # Rate limits and pagination
 PAGINATE_PAGE_SIZE: int = 30
 ANONYMOUS_THROTTLE_RATES_PER_HOUR: int = 300
@@ -24,6 +42,73 @@ USER_THROTTLE_RATES_PER_HOUR: int = 4000
 VERIFICATION_CODE_THROTTLE_RATES_PER_HOUR: int = 15
 MAX_UNSUCCESSFUL_LOGIN_COUNT: int = 5
 
+# In-process cache configuration
+USER_SNAPSHOT_LOCAL_CACHE_SIZE: int = 2048
+USER_SNAPSHOT_VERSION: int = 1
+
+# Logging configuration
+LOG_QUEUE_SIZE: int = 10000
+LOG_FILE_MAX_BYTES: int = 50 * 1024 * 1024
+LOG_FILE_BACKUP_COUNT: int = 10
+
+# Request logging policy (bodies and query params are captured on 4xx/5xx only)
+LOG_BODY_MAX_BYTES: int = 16 * 1024
+LOG_BODY_SKIPPED_CONTENT_TYPES: Tuple[str, ...] = (
+    "multipart/",
+    "application/octet-stream",
+    "image/",
+    "audio/",
+    "video/",
+)
+LOG_SUCCESS_SAMPLE_RATE: float = 1.0
+LOG_PATH_SAMPLE_RATES: Dict[str, float] = {}  # Path Prefix -> Rate (2xx/3xx)
+LOG_STATUS_SAMPLE_RATES: Dict[int, float] = {}  # Status Code -> Rate (2xx/3xx)
+
+# Database query instrumentation (per request)
+QUERY_BUDGET_DEFAULT: int = 30  # Override With BaseView.query_budget
+QUERY_LOG_SQL_MAX_LENGTH: int = 300
+QUERY_LOG_DUPLICATES_TOP: int = 5
+
+# Request profiling (disabled unless sampled or a signed staff header is sent)
+PROFILE_SAMPLE_RATE: float = 0.0
+PROFILE_HEADER: str = "HTTP_X_PROFILE"
+PROFILE_TOKEN_AGE: int = 30  # Minutes
+PROFILE_TOKEN_MAX_AGE: int = 120  # Minutes
+PROFILE_STATS_LIMIT: int = 30  # Rows Kept In The Admin Summary
+PROFILE_TRIGGER_SAMPLED: int = 10
+PROFILE_TRIGGER_HEADER: int = 20
+
+# Media cache headers (admin/ media is private and revalidated on every request)
+MEDIA_PUBLIC_CACHE_CONTROL: str = "public, max-age={}".format(DAY)
+MEDIA_PRIVATE_CACHE_CONTROL: str = "private, no-cache"
+
+# Metrics histogram buckets (in seconds)
+METRICS_REQUEST_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+)
+METRICS_REDIS_BUCKETS: Tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+)
+METRICS_TASK_BUCKETS: Tuple[float, ...] = (0.1, 0.5, 1, 5, 15, 60, 300, 900, 3600)
+
 # External API configuration
 
 # Financial constants (amounts in Iranian Toman)
@@ -45,6 +130,21 @@ PERSIAN_ENGLISH_NUMS: Dict[str, str] = {
     "۹": "9",
 }
 
+# Canonical Persian text for blind indexes and search (Arabic forms, digits, marks)
+PERSIAN_NORMALIZATION: Dict[str, str] = {
+    **PERSIAN_ENGLISH_NUMS,
+    **{chr(0x0660 + i): str(i) for i in range(10)},  # Arabic-Indic Digits
+    "ي": "ی",
+    "ى": "ی",
+    "ك": "ک",
+    "ة": "ه",
+    "ؤ": "و",
+    "ء": "",
+    "ـ": "",  # Tatweel
+    **{chr(c): "" for c in range(0x064B, 0x0653)},  # Harakat
+}
+SEARCH_VARIANTS_LIMIT: int = 32  # Character Variants Per Query (Plain Fields)
+
 # Persian (Jalali) month names
 PERSIAN_MONTHS: Dict[int, str] = {
     1: "فروردین",
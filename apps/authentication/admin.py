@@ -63,6 +63,7 @@ class UserAdmin(AbstractAdmin):
     )
     list_display_links = ("mobile",)
     search_fields = ("pk", "name", "mobile", "address")
+    trigram_search_fields = ("name", "mobile", "address")
 
     ordering = ("-created_at",)
     date_hierarchy = None
@@ -8,3 +8,6 @@ class authenticationConfig(AppConfig):
     name = "apps.authentication"
     label = "authentication"
     verbose_name = _("authentication")
+
+    def ready(self) -> None:
+        from . import signals  # noqa: F401
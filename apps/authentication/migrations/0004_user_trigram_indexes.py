@@ -0,0 +1,66 @@
+# Generated by Django 5.2.8 on 2026-10-18 07:02
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("authentication", "0003_alter_user_created_at_alter_user_updated_at"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="user",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    models.Func(
+                        django.db.models.functions.text.Upper("name"),
+                        models.Value("۰۱۲۳۴۵۶۷۸۹٠١٢٣٤٥٦٧٨٩يىكةؤءـًٌٍَُِّْ"),
+                        models.Value("01234567890123456789ییکهو"),
+                        function="TRANSLATE",
+                        output_field=models.TextField(),
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="user_name_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    models.Func(
+                        django.db.models.functions.text.Upper("mobile"),
+                        models.Value("۰۱۲۳۴۵۶۷۸۹٠١٢٣٤٥٦٧٨٩يىكةؤءـًٌٍَُِّْ"),
+                        models.Value("01234567890123456789ییکهو"),
+                        function="TRANSLATE",
+                        output_field=models.TextField(),
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="user_mobile_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    models.Func(
+                        django.db.models.functions.text.Upper("address"),
+                        models.Value("۰۱۲۳۴۵۶۷۸۹٠١٢٣٤٥٦٧٨٩يىكةؤءـًٌٍَُِّْ"),
+                        models.Value("01234567890123456789ییکهو"),
+                        function="TRANSLATE",
+                        output_field=models.TextField(),
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="user_address_trgm",
+            ),
+        ),
+    ]
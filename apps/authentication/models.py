@@ -71,6 +71,11 @@ class User(AbstractModel, AbstractBaseUser, PermissionsMixin):
     class Meta:
         verbose_name = _("user")
         verbose_name_plural = _("users")
+        indexes = [
+            trigram_index("name", "user_name_trgm"),
+            trigram_index("mobile", "user_mobile_trgm"),
+            trigram_index("address", "user_address_trgm"),
+        ]
 
     objects = _UserManager()
 
@@ -131,25 +131,21 @@ class AuthenticationSerializer(serializers.Serializer):
         user.save()
 
     def add_and_check_unsuccessful_login_limit(self) -> None:
-        # Get Cache
+        # Add Count (Atomic, Sliding Expiration)
         mobile: str = self.validated_data["mobile"]
         cache_key: str = UNSUCCESSFUL_LOGIN_COUNT_CACHE_PREFIX + mobile
-        count: Optional[int] = redis_client.get_int(cache_key)
-        if count is None:
-            count = 0
-
-        # Add Count
-        count += 1
+        count: int = redis_client.incr_with_ttl(
+            cache_key, UNSUCCESSFUL_LOGIN_COUNT_CACHE_AGE, sliding=True
+        )
 
-        if count >= MAX_UNSUCCESSFUL_LOGIN_COUNT:
-            user: Optional[User] = User.objects.filter(mobile=mobile).first()
+        if count < MAX_UNSUCCESSFUL_LOGIN_COUNT:
+            return
 
-            if user:
-                user.is_active = False
-                user.save()
-                self.reset_unsuccessful_login_limit()
-        else:
-            redis_client.set_int(cache_key, count, UNSUCCESSFUL_LOGIN_COUNT_CACHE_AGE)
+        user: Optional[User] = User.objects.filter(mobile=mobile).first()
+        if user:
+            user.is_active = False
+            user.save()
+            self.reset_unsuccessful_login_limit()
 
     def reset_unsuccessful_login_limit(self) -> None:
         mobile: str = self.validated_data["mobile"]
@@ -0,0 +1,18 @@
+from typing import Any
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from utils.session import invalidate_user_cache
+from .models import *
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_user_snapshot(sender: Any, instance: User, **kwargs: Any) -> None:
+    user_id: int = instance.pk
+    invalidate_user_cache(user_id)
+
+    # Drop Snapshots Rebuilt From Uncommitted Reads
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: invalidate_user_cache(user_id))
@@ -4,6 +4,12 @@
 mkdir -p /var/log/project_title/{nginx,supervisor,django}
 mkdir -p /var/log/project_title/nginx/tmp/{body,proxy,fastcgi,uwsgi,scgi}
 
+# Reset Shared Metrics Files (Stale Files From Previous Runs Skew Counters)
+if [ -n "$PROMETHEUS_MULTIPROC_DIR" ]; then
+    rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+    mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+fi
+
 # Run Migrations
 python manage.py migrate --skip-checks
 
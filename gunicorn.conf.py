@@ -0,0 +1,15 @@
+# Gunicorn Server Hooks (Loaded Automatically From The Working Directory)
+
+
+def worker_exit(server, worker) -> None:
+    # Flush Queued Log Records Before The Worker Process Ends
+    from project_title.log import log_pipeline
+
+    log_pipeline.stop()
+
+
+def child_exit(server, worker) -> None:
+    # Drop Live Gauges Of The Dead Worker From The Shared Metrics Directory
+    from services.metrics import mark_process_dead
+
+    mark_process_dead(worker.pid)
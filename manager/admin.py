@@ -57,3 +57,36 @@ class WalletHistoryAdmin(AbstractAdmin):
         "description",
     ]
     fields = ("user", "before", "charge", "description")
+
+
+@admin.register(RequestProfile)
+class RequestProfileAdmin(AbstractAdmin):
+    search_fields = ("path", "view", "user__pk", "user__mobile")
+    display_fields: list[str] = [
+        "id",
+        "created_at",
+        "method",
+        "path",
+        "view",
+        "status_code",
+        "duration_ms",
+        "trigger",
+        "user",
+        "file",
+    ]
+    select_related_fields: list[str] = ["user"]
+    readonly_fields = (
+        "user",
+        "method",
+        "path",
+        "view",
+        "status_code",
+        "duration_ms",
+        "trigger",
+        "summary",
+        "file",
+    )
+
+    def has_add_permission(self, request) -> bool:
+        # Rows Are Written By ProfilingMiddleware Only
+        return False
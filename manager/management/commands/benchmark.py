@@ -0,0 +1,431 @@
+import ast
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Tuple
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection
+from project_title.settings import SECRET_KEY
+
+from project_title import log
+from services.redis import RedisClient
+from tools.converters import different_persian_character_modes
+from tools.datetimes import jdt
+from tools.security import PAYLOAD_CIPHERS, PayloadCipher
+from utils.db import BLIND_INDEXES, EncryptedField, hash_to_db
+from utils.session import Session
+
+
+class Command(BaseCommand):
+    help = "Run Micro-Benchmarks"
+
+    TARGETS: Tuple[str, ...] = (
+        "redis-batch",
+        "redis-encoding",
+        "redis-cipher",
+        "log-format",
+        "log-timestamp",
+        "encrypted-ngrams",
+        "blind-index",
+        "ngram-explain",
+        "search-variants",
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("target", choices=self.TARGETS, type=str)
+        parser.add_argument("-n", "--number", default=1000, type=int)
+        parser.add_argument(
+            "--fake",
+            action="store_true",
+            help="Use an in-memory fakeredis server instead of REDIS_SERVER",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        self.number: int = options["number"]
+        self.fake: bool = options["fake"]
+
+        handler: Callable[[], None] = getattr(
+            self, "bench_{}".format(options["target"].replace("-", "_"))
+        )
+        handler()
+
+    # 1. Helpers
+
+    def get_redis_client(self) -> RedisClient:
+        client: RedisClient = RedisClient()
+        if self.fake:
+            try:
+                import fakeredis
+            except ImportError:
+                raise CommandError("fakeredis is not installed")
+            client.client = fakeredis.FakeStrictRedis()
+        return client
+
+    @staticmethod
+    def measure(func: Callable[[], Any], number: int) -> float:
+        # Return Microseconds Per Call
+        started: float = time.perf_counter()
+        for _ in range(number):
+            func()
+        return (time.perf_counter() - started) / number * 1_000_000
+
+    def report(self, title: str, rows: List[Tuple[str, float, str]]) -> None:
+        self.stdout.write(self.style.MIGRATE_HEADING(title))
+        for name, value, unit in rows:
+            self.stdout.write("  {:<40} {:>12.2f} {}".format(name, value, unit))
+
+    # 2. Targets
+
+    def bench_redis_batch(self) -> None:
+        client: RedisClient = self.get_redis_client()
+        batch: int = 100
+        rounds: int = max(self.number // batch, 1)
+        prefix: str = ":9:benchmark-batch-"
+        payloads: Dict[str, Any] = {
+            "{}{}".format(prefix, i): {"user_id": i, "content": {}, "expired": 0.0}
+            for i in range(batch)
+        }
+        keys: List[str] = list(payloads.keys())
+
+        def single_set() -> None:
+            for key, value in payloads.items():
+                client.set_json(key, value, 60)
+
+        def batch_set() -> None:
+            client.mset_json(payloads, 60)
+
+        def single_get() -> None:
+            for key in keys:
+                client.get_json(key)
+
+        def batch_get() -> None:
+            client.mget_json(keys)
+
+        rows: List[Tuple[str, float, str]] = [
+            ("set_json x {}".format(batch), self.measure(single_set, rounds), "µs"),
+            (
+                "mset_json ({} keys)".format(batch),
+                self.measure(batch_set, rounds),
+                "µs",
+            ),
+            ("get_json x {}".format(batch), self.measure(single_get, rounds), "µs"),
+            (
+                "mget_json ({} keys)".format(batch),
+                self.measure(batch_get, rounds),
+                "µs",
+            ),
+        ]
+        for key in keys:
+            client.delete(key)
+
+        self.report("Redis Single vs Batched ({} rounds)".format(rounds), rows)
+
+    def bench_redis_encoding(self) -> None:
+        client: RedisClient = self.get_redis_client()
+        shapes: Dict[str, bytes] = {
+            "vcode": b"12345",
+            "login counter": b"3",
+            "session json": client._dump_json(Session(user_id=1).model_dump()),
+        }
+
+        def legacy_encode(raw: bytes) -> bytes:
+            return client.cipher.encrypt(client.compressor.compress(raw))
+
+        rows: List[Tuple[str, float, str]] = []
+        for name, raw in shapes.items():
+            legacy_blob: bytes = legacy_encode(raw)
+            framed_blob: bytes = client._encode(raw)
+            rows += [
+                ("{} raw".format(name), len(raw), "bytes"),
+                ("{} legacy blob".format(name), len(legacy_blob), "bytes"),
+                ("{} framed blob".format(name), len(framed_blob), "bytes"),
+                (
+                    "{} legacy encode+decode".format(name),
+                    self.measure(
+                        lambda: client._decode(legacy_encode(raw)), self.number
+                    ),
+                    "µs",
+                ),
+                (
+                    "{} framed encode+decode".format(name),
+                    self.measure(
+                        lambda: client._decode(client._encode(raw)), self.number
+                    ),
+                    "µs",
+                ),
+            ]
+
+        self.report("Redis Payload Encoding ({} rounds)".format(self.number), rows)
+
+    def bench_redis_cipher(self) -> None:
+        client: RedisClient = self.get_redis_client()
+        shapes: Dict[str, bytes] = {
+            "session": client._compress(
+                client._dump_json(Session(user_id=1).model_dump())
+            ),
+            "4 KB random": client._compress(os.urandom(4096)),
+        }
+
+        rows: List[Tuple[str, float, str]] = []
+        for name, cipher_class in PAYLOAD_CIPHERS.items():
+            cipher: PayloadCipher = cipher_class(SECRET_KEY)
+            for shape, payload in shapes.items():
+                blob: bytes = cipher.encrypt(payload)
+                rows += [
+                    ("{} {} blob".format(name, shape), len(blob), "bytes"),
+                    (
+                        "{} {} encrypt+decrypt".format(name, shape),
+                        self.measure(
+                            lambda: cipher.decrypt(cipher.encrypt(payload)),
+                            self.number,
+                        ),
+                        "µs",
+                    ),
+                ]
+
+        self.report("Redis Payload Ciphers ({} rounds)".format(self.number), rows)
+
+    def bench_log_format(self) -> None:
+        # LoggingMiddleware Payload Shape
+        payload: Dict[str, Any] = {
+            "method": "POST",
+            "path": "/api/v1/auth/",
+            "status_code": 200,
+            "duration_ms": 12.34,
+            "ip": "127.0.0.1",
+            "body": {"mobile": "09101234567", "code": "12345", "name": "علی رضایی"},
+            "files": 0,
+            "query_params": {"page": ["1"], "filter__name": ["علی"]},
+            "user": 1,
+            "db_request_count": 3,
+        }
+        record: logging.LogRecord = logging.LogRecord(
+            "utils.middlewares", logging.INFO, __file__, 1, payload, None, None
+        )
+        formatter: log.JsonFormatter = log.JsonFormatter()
+
+        def legacy_format() -> str:
+            # Previous Path: repr -> ast.literal_eval -> json.dumps
+            details: Any = ast.literal_eval(record.getMessage())
+            return json.dumps({"extra": details}, ensure_ascii=False)
+
+        def structured_json() -> str:
+            return json.dumps(
+                {"extra": record.msg}, ensure_ascii=False, default=log.json_default
+            )
+
+        def structured_fast() -> str:
+            return log.dumps({"extra": record.msg})
+
+        def per_second(func: Callable[[], Any]) -> float:
+            return 1_000_000 / self.measure(func, self.number)
+
+        rows: List[Tuple[str, float, str]] = [
+            ("legacy literal_eval + json", per_second(legacy_format), "records/s"),
+            ("structured + json", per_second(structured_json), "records/s"),
+            (
+                "structured + {}".format("orjson" if log.orjson else "json"),
+                per_second(structured_fast),
+                "records/s",
+            ),
+            (
+                "JsonFormatter.format (full record)",
+                per_second(lambda: formatter.format(record)),
+                "records/s",
+            ),
+        ]
+
+        self.report("Log Record Serialization ({} rounds)".format(self.number), rows)
+
+    def bench_log_timestamp(self) -> None:
+        # Records Spread Over A Few Seconds (Like A Busy Worker)
+        started: float = time.time()
+        stamps: List[float] = [started + i * 0.0007 for i in range(max(self.number, 1))]
+
+        def legacy_format(created: float) -> Tuple[str, str]:
+            return (
+                datetime.fromtimestamp(created).isoformat() + "Z",
+                jdt.datetime.fromgregorian(
+                    datetime=datetime.fromtimestamp(created)
+                ).isoformat()
+                + "Z",
+            )
+
+        cache: log.TimestampCache = log.TimestampCache()
+        for created in stamps[:100]:
+            if cache.format(created) != legacy_format(created):
+                raise CommandError("Cached timestamp differs at {}".format(created))
+
+        def run(func: Callable[[float], Tuple[str, str]]) -> Callable[[], None]:
+            def inner() -> None:
+                for created in stamps:
+                    func(created)
+
+            return inner
+
+        rows: List[Tuple[str, float, str]] = [
+            (
+                "fromtimestamp + fromgregorian",
+                self.measure(run(legacy_format), 1) / len(stamps),
+                "µs",
+            ),
+            (
+                "TimestampCache.format",
+                self.measure(run(log.TimestampCache().format), 1) / len(stamps),
+                "µs",
+            ),
+        ]
+
+        self.report("Log Timestamps ({} records)".format(len(stamps)), rows)
+
+    def bench_encrypted_ngrams(self) -> None:
+        shapes: Dict[str, str] = {
+            "address": (
+                "تهران خیابان ولیعصر بالاتر از میدان ونک کوچه بهار پلاک ۱۲ واحد ۳"
+            ),
+            "iban + email": (
+                "IR820540102680020817909002 mohammad.hosseini.1370@gmail.com"
+            ),
+        }
+        fields: Dict[str, EncryptedField] = {
+            "all": EncryptedField(hash_field="h", ngram_field="n"),
+            "all max_length=6": EncryptedField(
+                hash_field="h", ngram_field="n", ngram_max_length=6
+            ),
+            "trigram": EncryptedField(
+                hash_field="h", ngram_field="n", ngram_strategy="trigram"
+            ),
+        }
+
+        def index(field: EncryptedField, value: str) -> List[str]:
+            # Same Work As EncryptedField.pre_save
+            return [hash_to_db(gram) for gram in field.index_ngrams(value)]
+
+        rows: List[Tuple[str, float, str]] = []
+        for shape, value in shapes.items():
+            for name, field in fields.items():
+                rows += [
+                    (
+                        "{} {} hashes".format(shape, name),
+                        len(index(field, value)),
+                        "items",
+                    ),
+                    (
+                        "{} {} index".format(shape, name),
+                        self.measure(
+                            lambda: index(field, value), max(self.number // 10, 1)
+                        ),
+                        "µs",
+                    ),
+                ]
+
+        self.report("Encrypted Field Blind Index", rows)
+
+    def bench_blind_index(self) -> None:
+        grams: List[str] = EncryptedField(hash_field="h", ngram_field="n").index_ngrams(
+            "IR820540102680020817909002 mohammad.hosseini.1370@gmail.com"
+        )
+
+        rows: List[Tuple[str, float, str]] = []
+        for version, hasher in BLIND_INDEXES.items():
+            rows += [
+                (
+                    "version {} digest".format(version),
+                    len(hasher(grams[0])),
+                    "chars",
+                ),
+                (
+                    "version {} x {} grams".format(version, len(grams)),
+                    self.measure(
+                        lambda: [hasher(gram) for gram in grams],
+                        max(self.number // 10, 1),
+                    ),
+                    "µs",
+                ),
+            ]
+
+        self.report("Blind Index Hashers", rows)
+
+    def bench_ngram_explain(self) -> None:
+        # Needs PostgreSQL; -n Is The Row Count (e.g. -n 1000000)
+        if connection.vendor != "postgresql":
+            raise CommandError("ngram-explain needs a PostgreSQL database")
+
+        variants: List[str] = [hash_to_db("variant-{}".format(i)) for i in range(16)]
+        or_contains: str = " OR ".join(
+            "ngrams @> ARRAY['{}']::varchar[]".format(h) for h in variants
+        )
+        overlap: str = "ngrams && ARRAY[{}]::varchar[]".format(
+            ", ".join("'{}'".format(h) for h in variants)
+        )
+
+        def explain(cursor: Any, where: str) -> Tuple[float, str]:
+            cursor.execute(
+                "EXPLAIN (ANALYZE, FORMAT JSON) SELECT id FROM benchmark_ngrams "
+                "WHERE {}".format(where)
+            )
+            plan: Dict[str, Any] = cursor.fetchone()[0][0]
+            return plan["Execution Time"], plan["Plan"]["Node Type"]
+
+        with connection.cursor() as cursor:
+            # 20 Random 32-Char Hashes Per Row (Like Trigram Blind Indexes)
+            cursor.execute(
+                "CREATE TEMP TABLE benchmark_ngrams AS SELECT i AS id, ARRAY("
+                "SELECT substr(md5(i::text || '-' || j::text), 1, 32) "
+                "FROM generate_series(1, 20) j)::varchar[] AS ngrams "
+                "FROM generate_series(1, %s) i",
+                [self.number],
+            )
+            cursor.execute(
+                "CREATE INDEX ON benchmark_ngrams USING gin (ngrams); "
+                "ANALYZE benchmark_ngrams"
+            )
+            try:
+                or_time, or_node = explain(cursor, or_contains)
+                overlap_time, overlap_node = explain(cursor, overlap)
+            finally:
+                cursor.execute("DROP TABLE benchmark_ngrams")
+
+        self.report(
+            "Ngram Search Plans ({} rows, {} variants)".format(
+                self.number, len(variants)
+            ),
+            [
+                ("OR of @> ({})".format(or_node), or_time * 1000, "µs"),
+                ("single && ({})".format(overlap_node), overlap_time * 1000, "µs"),
+            ],
+        )
+
+    def bench_search_variants(self) -> None:
+        query: str = "۰۹۱۲۳۴۵۶۷۸۹"
+        legacy: EncryptedField = EncryptedField(hash_field="h", ngram_field="n")
+        normalized: EncryptedField = EncryptedField(
+            hash_field="h", ngram_field="n", normalize=True
+        )
+
+        def expand_all() -> List[str]:
+            # Previous Behaviour: Every Combination (2^k)
+            return different_persian_character_modes(query, limit=2 ** len(query))
+
+        rows: List[Tuple[str, float, str]] = []
+        for name, modes in (
+            ("all variants", expand_all),
+            ("capped variants", lambda: legacy.search_modes(query)),
+            ("normalize_persian", lambda: normalized.search_modes(query)),
+        ):
+            rows += [
+                ("{} hashes".format(name), len(modes()), "items"),
+                (
+                    "{} expand + hash".format(name),
+                    self.measure(
+                        lambda: [hash_to_db(mode) for mode in modes()],
+                        max(self.number // 100, 1),
+                    ),
+                    "µs",
+                ),
+            ]
+
+        self.report("Search Variants For {!r}".format(query), rows)
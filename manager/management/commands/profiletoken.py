@@ -0,0 +1,39 @@
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from project_title.settings import SECRET_KEY
+
+from CONSTANTS import PROFILE_TOKEN_AGE, PROFILE_TOKEN_MAX_AGE
+from apps.authentication.models import User
+from tools.security import create_token
+
+
+class Command(BaseCommand):
+    help = "Create A Signed X-Profile Header For A Staff User"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("mobile", type=str)
+        parser.add_argument(
+            "-m",
+            "--minutes",
+            default=PROFILE_TOKEN_AGE,
+            type=int,
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if not 0 < options["minutes"] <= PROFILE_TOKEN_MAX_AGE:
+            raise CommandError(
+                "Minutes must be between 1 and {}".format(PROFILE_TOKEN_MAX_AGE)
+            )
+
+        user: User = User.objects.filter(mobile=options["mobile"]).first()
+        if not user or not (user.is_staff or user.is_superuser):
+            raise CommandError("Staff user not found")
+
+        token: str = create_token(
+            key=SECRET_KEY,
+            data={"user_id": user.pk, "profile": True, "iat": int(time.time())},
+            expire_minutes=options["minutes"],
+        )
+        self.stdout.write("X-Profile: {}".format(token))
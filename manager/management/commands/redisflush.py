@@ -2,7 +2,8 @@ from typing import Any
 
 import redis
 from django.core.management.base import BaseCommand, CommandParser
-from project_title.settings import REDIS_SERVER
+
+from services.redis import get_redis_connection
 
 
 class Command(BaseCommand):
@@ -19,7 +20,7 @@ class Command(BaseCommand):
     def handle(self, *args: Any, **options: Any) -> None:
         prefix: str = options["prefix"]
 
-        redis_client: redis.StrictRedis = redis.StrictRedis.from_url(REDIS_SERVER)
+        redis_client: redis.Redis = get_redis_connection()
 
         if prefix:
             keys_to_delete: list = []
@@ -0,0 +1,99 @@
+from itertools import islice
+from typing import Any, Generator, List, Optional
+
+import zstandard as zstd
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from CONSTANTS import (
+    REDIS_BATCH_SIZE,
+    USER_SESSION_KEY_PREFIX,
+    ZSTD_DICTIONARY_SIZE,
+    ZSTD_DICTIONARY_SAMPLES,
+)
+from services.redis import redis_client
+
+
+class Command(BaseCommand):
+    help = "Train A zstd Dictionary From Redis Payloads"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "-p",
+            "--prefix",
+            default=USER_SESSION_KEY_PREFIX,
+            type=str,
+        )
+        parser.add_argument(
+            "-s",
+            "--samples",
+            default=ZSTD_DICTIONARY_SAMPLES,
+            type=int,
+        )
+        parser.add_argument(
+            "--size",
+            default=ZSTD_DICTIONARY_SIZE,
+            type=int,
+        )
+        parser.add_argument(
+            "--no-activate",
+            action="store_true",
+            help="Store the dictionary without making it the active one",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        prefix: str = options["prefix"]
+        max_samples: int = options["samples"]
+
+        # Collect Decoded Payloads
+        samples: List[bytes] = []
+        keys_iter: Generator = redis_client.get_keys_by_prefix(prefix=prefix)
+        while len(samples) < max_samples:
+            keys: List[str] = [
+                k.decode("utf-8") for k in islice(keys_iter, REDIS_BATCH_SIZE)
+            ]
+            if not keys:
+                break
+            raws: List[Optional[bytes]] = redis_client._mget_raw(keys)
+            samples += [raw for raw in raws if raw]
+
+        samples = samples[:max_samples]
+        if len(samples) < 10:
+            raise CommandError(
+                "Not enough samples for prefix {} ({})".format(prefix, len(samples))
+            )
+
+        # Train
+        try:
+            dictionary: zstd.ZstdCompressionDict = zstd.train_dictionary(
+                options["size"], samples
+            )
+        except zstd.ZstdError as e:
+            raise CommandError("Dictionary training failed: {}".format(e))
+
+        # Compare Ratios
+        plain: zstd.ZstdCompressor = zstd.ZstdCompressor(
+            level=redis_client.COMPRESS_LEVEL
+        )
+        trained: zstd.ZstdCompressor = zstd.ZstdCompressor(
+            level=redis_client.COMPRESS_LEVEL, dict_data=dictionary
+        )
+        raw_size: int = sum(len(s) for s in samples)
+        plain_size: int = sum(len(plain.compress(s)) for s in samples)
+        trained_size: int = sum(len(trained.compress(s)) for s in samples)
+
+        dictionary_id: int = redis_client.save_dictionary(
+            dictionary, activate=not options["no_activate"]
+        )
+
+        self.stdout.write(
+            "Samples: {} | Raw: {} B | zstd: {} B | zstd+dict: {} B".format(
+                len(samples), raw_size, plain_size, trained_size
+            )
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Dictionary {} Stored{}".format(
+                    dictionary_id, "" if options["no_activate"] else " And Activated"
+                )
+            )
+        )
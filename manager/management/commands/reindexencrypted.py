@@ -0,0 +1,115 @@
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Type
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import models, transaction
+
+from CONSTANTS import BLIND_INDEX_BATCH_SIZE
+from utils.db import EncryptedField
+
+
+class Command(BaseCommand):
+    help = "Rebuild EncryptedField Hash And N-Gram Columns"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "-m",
+            "--model",
+            default=None,
+            type=str,
+            help="Only this model (app_label.ModelName)",
+        )
+        parser.add_argument(
+            "-b",
+            "--batch-size",
+            default=BLIND_INDEX_BATCH_SIZE,
+            type=int,
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        targets: Dict[Type[models.Model], List[EncryptedField]] = self.get_targets(
+            options["model"]
+        )
+        if not targets:
+            raise CommandError("No model with an EncryptedField found")
+
+        for model, fields in targets.items():
+            count: int = self.reindex(model, fields, options["batch_size"])
+            self.stdout.write(
+                "{}: {} Rows ({})".format(
+                    model._meta.label, count, ", ".join(f.name for f in fields)
+                )
+            )
+
+        self.stdout.write(self.style.SUCCESS("Encrypted Indexes Rebuilt"))
+
+    @staticmethod
+    def get_targets(
+        label: Optional[str],
+    ) -> Dict[Type[models.Model], List[EncryptedField]]:
+        if label:
+            try:
+                candidates: List[Type[models.Model]] = [apps.get_model(label)]
+            except (LookupError, ValueError):
+                raise CommandError("Unknown model {}".format(label))
+        else:
+            candidates = apps.get_models()
+
+        targets: Dict[Type[models.Model], List[EncryptedField]] = {}
+        for model in candidates:
+            fields: List[EncryptedField] = [
+                field
+                for field in model._meta.concrete_fields
+                if isinstance(field, EncryptedField)
+            ]
+            if fields:
+                targets[model] = fields
+        return targets
+
+    @staticmethod
+    def reindex(
+        model: Type[models.Model], fields: List[EncryptedField], batch_size: int
+    ) -> int:
+        index_columns: List[str] = [
+            name
+            for field in fields
+            for name in (field.hash_field_name, field.ngram_field_name)
+        ]
+        only: List[str] = ["pk", *[field.name for field in fields]]
+        pks: Iterator[Any] = (
+            model._base_manager.order_by("pk")
+            .values_list("pk", flat=True)
+            .iterator(chunk_size=batch_size)
+        )
+
+        count: int = 0
+        while True:
+            batch_pks: List[Any] = list(islice(pks, batch_size))
+            if not batch_pks:
+                break
+
+            with transaction.atomic():
+                # Locked Re-Read: A Concurrent save() Can't Be Overwritten With
+                # Hashes Of A Stale Value
+                batch: List[models.Model] = list(
+                    model._base_manager.select_for_update()
+                    .only(*only)
+                    .filter(pk__in=batch_pks)
+                    .order_by("pk")
+                )
+
+                # Recompute With Each Field's Current index_version And Strategy
+                for instance in batch:
+                    for field in fields:
+                        value: Optional[str] = getattr(instance, field.attname)
+                        if value is None:
+                            continue
+                        hashed_value, hashed_ngrams = field.build_index(value)
+                        setattr(instance, field.hash_field_name, hashed_value)
+                        setattr(instance, field.ngram_field_name, hashed_ngrams)
+
+                model._base_manager.bulk_update(batch, index_columns)
+            count += len(batch)
+
+        return count
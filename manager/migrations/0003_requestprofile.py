@@ -0,0 +1,76 @@
+# Generated by Django 5.2.8 on 2026-10-18 06:50
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("manager", "0002_alter_adminactionlog_options_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RequestProfile",
+            fields=[
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Created At"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="Updated At"),
+                ),
+                ("method", models.CharField(max_length=10, verbose_name="method")),
+                ("path", models.CharField(max_length=1024, verbose_name="path")),
+                (
+                    "view",
+                    models.CharField(
+                        blank=True, max_length=255, null=True, verbose_name="view"
+                    ),
+                ),
+                (
+                    "status_code",
+                    models.PositiveSmallIntegerField(verbose_name="status code"),
+                ),
+                ("duration_ms", models.FloatField(verbose_name="duration (ms)")),
+                (
+                    "trigger",
+                    models.PositiveSmallIntegerField(
+                        choices=[(10, "sampled"), (20, "signed header")],
+                        verbose_name="trigger",
+                    ),
+                ),
+                (
+                    "summary",
+                    models.TextField(blank=True, null=True, verbose_name="summary"),
+                ),
+                (
+                    "file",
+                    models.FileField(
+                        upload_to="admin/profiles/", verbose_name="profile file"
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="request_profiles",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="user",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "request profile",
+                "verbose_name_plural": "request profiles",
+                "ordering": ["-created_at"],
+            },
+        ),
+    ]
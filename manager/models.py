@@ -3,6 +3,7 @@ from typing import Optional
 from author.decorators import with_author
 from project_title.log import logger_set
 
+from CONSTANTS import PROFILE_TRIGGER_HEADER, PROFILE_TRIGGER_SAMPLED
 from apps.authentication.models import User
 from tools.converters import _
 from utils.abstract import AdminRequestAbstract, AbstractModel
@@ -14,6 +15,7 @@ __all__ = [
     "AdminActionLog",
     "ChargeWalletRequest",
     "WalletHistory",
+    "RequestProfile",
 ]
 
 
@@ -128,3 +130,52 @@ class WalletHistory(AbstractModel):
 
     def __str__(self) -> str:
         return "{} - {}".format(self.user, self.description)
+
+
+PROFILE_TRIGGERS: tuple = (
+    (PROFILE_TRIGGER_SAMPLED, _("sampled")),
+    (PROFILE_TRIGGER_HEADER, _("signed header")),
+)
+
+
+class RequestProfile(AbstractModel):
+    user: Optional[User] = models.ForeignKey(
+        "authentication.User",
+        on_delete=models.SET_NULL,
+        related_name="request_profiles",
+        verbose_name=_("user"),
+        null=True,
+        blank=True,
+    )
+
+    method: str = models.CharField(verbose_name=_("method"), max_length=10)
+    path: str = models.CharField(verbose_name=_("path"), max_length=1024)
+    view: Optional[str] = models.CharField(
+        verbose_name=_("view"),
+        max_length=255,
+        null=True,
+        blank=True,
+    )
+    status_code: int = models.PositiveSmallIntegerField(verbose_name=_("status code"))
+    duration_ms: float = models.FloatField(verbose_name=_("duration (ms)"))
+    trigger: int = models.PositiveSmallIntegerField(
+        verbose_name=_("trigger"),
+        choices=PROFILE_TRIGGERS,
+    )
+    summary: Optional[str] = models.TextField(
+        verbose_name=_("summary"),
+        null=True,
+        blank=True,
+    )
+    file: Optional[str] = models.FileField(
+        verbose_name=_("profile file"),
+        upload_to="admin/profiles/",
+    )
+
+    class Meta:
+        ordering = ["-created_at"]
+        verbose_name = _("request profile")
+        verbose_name_plural = _("request profiles")
+
+    def __str__(self) -> str:
+        return "{} {} - {} ms".format(self.method, self.path, self.duration_ms)
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from .views import *
+
+app_name = "manager"
+
+urlpatterns = [
+    path("", Metrics.as_view(), name="metrics"),
+]
@@ -0,0 +1,23 @@
+from django.http import HttpResponse
+
+from services.metrics import render_metrics
+from utils.permissions import MetricsPermission
+from utils.views import BaseView
+
+__all__ = [
+    "Metrics",
+]
+
+
+class Metrics(BaseView):
+    """
+    GET -> Prometheus Metrics (Bearer METRICS_TOKEN)
+    """
+
+    authentication_classes = []
+    permission_classes = [MetricsPermission]
+    throttle_classes = []
+
+    def get(self, request, **kwargs):
+        body, content_type = render_metrics()
+        return HttpResponse(body, content_type=content_type)
@@ -0,0 +1,16 @@
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "project_title.settings")
+
+# Import IS_PRODUCTION after setting DJANGO_SETTINGS_MODULE
+from project_title.settings import IS_PRODUCTION
+
+application = get_asgi_application()
+
+if IS_PRODUCTION:
+    # For load static files in hosts (ASGI counterpart of dj_static Cling)
+    from django.contrib.staticfiles.handlers import ASGIStaticFilesHandler
+
+    application = ASGIStaticFilesHandler(application)
@@ -1,37 +1,96 @@
-import ast
+import atexit
+import copy
 import json
 import logging
 import os
+import queue
+import threading
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, List, Optional, Tuple
 
 from project_title.settings import LOG_DIR
 
+from CONSTANTS import LOG_FILE_BACKUP_COUNT, LOG_FILE_MAX_BYTES, LOG_QUEUE_SIZE
+from tools.cache import Counters
 from tools.datetimes import jdt
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 PROCESS_TYPE = os.getenv("PROCESS_TYPE", "django")
 
 LOG_PATH = f"{LOG_DIR}/django/{PROCESS_TYPE}"
 
+log_stats = Counters("enqueued", "dropped")
+
+
+def json_default(obj: Any) -> str:
+    """Fallback for values json cannot encode (datetimes, UUIDs, Decimals, ...)"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+def dumps(data: dict) -> str:
+    """Serialize a log record with orjson when available, stdlib json otherwise"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data, default=json_default, option=orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            # orjson Rejects Some Values (e.g. ints Beyond 64 Bits)
+            pass
+    return json.dumps(data, ensure_ascii=False, default=json_default)
+
+
+class TimestampCache:
+    """Per-second memo of the Gregorian and Jalali ISO timestamps"""
+
+    def __init__(self) -> None:
+        # (second, gregorian prefix, jalali prefix), swapped as one tuple
+        self.cached: Tuple[Optional[datetime], str, str] = (None, "", "")
+
+    def format(self, created: float) -> Tuple[str, str]:
+        moment = datetime.fromtimestamp(created)
+        second = moment.replace(microsecond=0)
+
+        cached = self.cached
+        if cached[0] != second:
+            cached = (
+                second,
+                second.isoformat(),
+                jdt.datetime.fromgregorian(datetime=second).isoformat(),
+            )
+            self.cached = cached
+
+        # Same sub-second rule as isoformat(): omitted when zero
+        suffix = ".{:06d}Z".format(moment.microsecond) if moment.microsecond else "Z"
+        return cached[1] + suffix, cached[2] + suffix
+
+
+timestamp_cache = TimestampCache()
+
 
 class JsonFormatter(logging.Formatter):
     """Structured JSON Formatter for ELK"""
 
     def format(self, record: logging.LogRecord) -> str:
 
-        # Parse message
-        try:
-            details = ast.literal_eval(record.getMessage())
-        except SyntaxError:
+        # Structured records carry their dict as msg (no string round trip)
+        if isinstance(record.msg, dict):
+            details = record.msg
+        else:
             details = record.getMessage()
 
         # Data
+        gregorian, jalali = timestamp_cache.format(record.created)
         log_record = {
-            "@timestamp": datetime.fromtimestamp(record.created).isoformat() + "Z",
-            "jalali_datetime": jdt.datetime.fromgregorian(
-                datetime=datetime.fromtimestamp(record.created)
-            ).isoformat()
-            + "Z",
+            "@timestamp": gregorian,
+            "jalali_datetime": jalali,
             "level": record.levelname,
             "logger": record.name,
             "module": record.module,
@@ -51,7 +110,7 @@ class JsonFormatter(logging.Formatter):
             log_record["message"] = details
             log_record["extra"] = None
 
-        return json.dumps(log_record, ensure_ascii=False)
+        return dumps(log_record)
 
 
 class TextFormatter(logging.Formatter):
@@ -64,8 +123,97 @@ class TextFormatter(logging.Formatter):
         )
 
 
+class BoundedQueueHandler(QueueHandler):
+    """Enqueue records without blocking; drop (and count) when the queue is full"""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+            log_stats.incr("enqueued")
+        except queue.Full:
+            log_stats.incr("dropped")
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Keep dict messages and exc_info intact for the file formatters
+        # (records never leave the process, so nothing needs pickling)
+        record = copy.copy(record)
+        if record.args and not isinstance(record.msg, dict):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+class LogPipeline:
+    """Single background writer fanning queued records out to the log files"""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        self.handler = BoundedQueueHandler(self.queue)
+        self.handler.setLevel(logging.INFO)
+        self.listener: Optional[QueueListener] = None
+
+    @staticmethod
+    def file_handlers() -> List[logging.Handler]:
+        # JSON file handler
+        json_handler = RotatingFileHandler(
+            LOG_PATH + ".json.log",
+            maxBytes=LOG_FILE_MAX_BYTES,
+            backupCount=LOG_FILE_BACKUP_COUNT,
+            encoding="utf-8",
+        )
+        json_handler.setFormatter(JsonFormatter())
+        json_handler.setLevel(logging.INFO)
+
+        # Text file handler
+        text_handler = RotatingFileHandler(
+            LOG_PATH + ".log",
+            maxBytes=LOG_FILE_MAX_BYTES,
+            backupCount=LOG_FILE_BACKUP_COUNT,
+            encoding="utf-8",
+        )
+        text_handler.setFormatter(TextFormatter())
+        text_handler.setLevel(logging.INFO)
+
+        return [json_handler, text_handler]
+
+    def start(self) -> None:
+        with self.lock:
+            if self.listener is not None:
+                return
+            self.listener = QueueListener(
+                self.queue, *self.file_handlers(), respect_handler_level=True
+            )
+            self.listener.start()
+
+    def stop(self) -> None:
+        """Drain the queue and close the files (safe to call more than once)"""
+        with self.lock:
+            if self.listener is None:
+                return
+            self.listener.stop()
+            for handler in self.listener.handlers:
+                handler.close()
+            self.listener = None
+
+    def reset_after_fork(self) -> None:
+        # The writer thread does not survive fork; start a fresh one lazily
+        self.lock = threading.Lock()
+        self.queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        self.handler.queue = self.queue
+        restart = self.listener is not None
+        self.listener = None
+        if restart:
+            self.start()
+
+
+log_pipeline = LogPipeline()
+atexit.register(log_pipeline.stop)
+os.register_at_fork(after_in_child=log_pipeline.reset_after_fork)
+
+
 def logger_set(app: str) -> logging.Logger:
-    """Create a logger with JSON and Text file handlers"""
+    """Create a logger writing through the shared JSON and Text file queue"""
     logger = logging.getLogger(app)
     logger.setLevel(logging.INFO)
     logger.propagate = False
@@ -73,27 +221,7 @@ def logger_set(app: str) -> logging.Logger:
     if logger.handlers:
         return logger
 
-    # JSON file handler
-    json_handler = RotatingFileHandler(
-        LOG_PATH + ".json.log",
-        maxBytes=50 * 1024 * 1024,
-        backupCount=10,
-        encoding="utf-8",
-    )
-    json_handler.setFormatter(JsonFormatter())
-    json_handler.setLevel(logging.INFO)
-
-    # Text file handler
-    text_handler = RotatingFileHandler(
-        LOG_PATH + ".log",
-        maxBytes=50 * 1024 * 1024,
-        backupCount=10,
-        encoding="utf-8",
-    )
-    text_handler.setFormatter(TextFormatter())
-    text_handler.setLevel(logging.INFO)
-
-    logger.addHandler(json_handler)
-    logger.addHandler(text_handler)
+    log_pipeline.start()
+    logger.addHandler(log_pipeline.handler)
 
     return logger
@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict
 
 from CONSTANTS import (
     ADMIN_SESSION_COOKIE_AGE,
@@ -38,6 +38,7 @@ INSTALLED_APPS = [
 # URLs and deployment configuration
 ROOT_URLCONF = "project_title.urls"
 WSGI_APPLICATION = "project_title.wsgi.application"
+ASGI_APPLICATION = "project_title.asgi.application"
 SHORT_LINK_PATH = "s"
 
 TEMPLATES = [
@@ -64,6 +65,8 @@ ASSETS_URL = "/assets/"  # By Nginx (IMG - AUDIO - VIDEO)
 STATIC_URL = "/static/"  # By Nginx (CSS, JS, FONTS, CDN, APK)
 MEDIA_URL = "/storage/"  # By Middleware (Uploads)
 MEDIA_ROOT = os.path.join(BASE_DIR, "storage")
+MEDIA_ACCEL_REDIRECT = False  # Hand Media Bytes To Nginx After Access Checks
+MEDIA_ACCEL_PREFIX = "/protected-storage/"  # Internal Nginx Location
 
 # Default primary key field type
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
@@ -82,6 +85,8 @@ MANAGEMENT_ARGS = [
     "migrate",
     "loaddata",
     "redisflush",
+    "redistrain",
+    "benchmark",
 ]
 
 # Password hashing configuration
@@ -95,6 +100,8 @@ PASSWORD_HASHERS = [
 
 # Middleware configuration
 MIDDLEWARE = [
+    "utils.middlewares.MetricsMiddleware",
+    "utils.middlewares.ProfilingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -103,13 +110,26 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    "author.middlewares.AuthorDefaultBackendMiddleware",
+    "utils.middlewares.AuthorMiddleware",
     "utils.middlewares.IPIdentificationMiddleware",
     "utils.middlewares.IPBlockMiddleware",
     "utils.middlewares.LoggingMiddleware",
     "utils.middlewares.MediaMiddleware",
 ]
 
+# Redis connection pool configuration (shared by RedisClient, cache and commands)
+REDIS_POOL: Dict[str, Any] = {
+    "MAX_CONNECTIONS": int(os.getenv("REDIS_MAX_CONNECTIONS", 16)),
+    "POOL_TIMEOUT": float(os.getenv("REDIS_POOL_TIMEOUT", 5)),
+    "SOCKET_TIMEOUT": float(os.getenv("REDIS_SOCKET_TIMEOUT", 5)),
+    "SOCKET_CONNECT_TIMEOUT": float(os.getenv("REDIS_SOCKET_CONNECT_TIMEOUT", 2)),
+    "SOCKET_KEEPALIVE": True,
+    "HEALTH_CHECK_INTERVAL": int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", 30)),
+    "RETRIES": int(os.getenv("REDIS_RETRIES", 3)),
+    "RETRY_BACKOFF_BASE": 0.01,
+    "RETRY_BACKOFF_CAP": 0.5,
+}
+
 # Session configuration
 SESSION_ENGINE = "django.contrib.sessions.backends.cache"
 SESSION_COOKIE_AGE = ADMIN_SESSION_COOKIE_AGE
@@ -118,7 +138,7 @@ SESSION_SAVE_EVERY_REQUEST = True
 # REST framework configuration
 REST_FRAMEWORK = {
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "utils.renderers.TimedJSONRenderer",
     ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "utils.permissions.TokenAuthentication",
@@ -149,6 +169,14 @@ CELERY_TIMEZONE = "Asia/Tehran"
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
 CELERY_RESULT_EXTENDED = True
 CELERY_RESULT_BACKEND = "django-db"
+CELERY_BROKER_POOL_LIMIT = REDIS_POOL["MAX_CONNECTIONS"]
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    "socket_timeout": REDIS_POOL["SOCKET_TIMEOUT"],
+    "socket_connect_timeout": REDIS_POOL["SOCKET_CONNECT_TIMEOUT"],
+    "socket_keepalive": REDIS_POOL["SOCKET_KEEPALIVE"],
+    "health_check_interval": REDIS_POOL["HEALTH_CHECK_INTERVAL"],
+    "retry_on_timeout": True,
+}
 
 # Client application redirect URLs
 APP_URLS: Dict[str, str] = {}
@@ -27,6 +27,9 @@ DATABASES = {
 # Redis configuration
 REDIS_SERVER = "redis://localhost:6379/0"
 
+# Redis payload cipher (fernet | aesgcm | chacha20)
+REDIS_CIPHER = "aesgcm"
+
 # Cache configuration
 CACHES = {
     "default": {
@@ -35,6 +38,7 @@ CACHES = {
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
             "COMPRESSOR": "django_redis.compressors.zlib.ZlibCompressor",
+            "CONNECTION_FACTORY": "services.redis.SharedConnectionFactory",
         },
     }
 }
@@ -42,6 +46,7 @@ CACHES = {
 # Security keys
 KEY = "ktvI9-rYqmgR8aDNVYqAnZ5ErWAVTj552OIouLEqyzg="
 SECRET_KEY = KEY
+METRICS_TOKEN = "metrics"
 
 # External API keys
 
@@ -35,6 +35,9 @@ DATABASES = {
 # Redis configuration
 REDIS_SERVER = os.getenv("REDIS")
 
+# Redis payload cipher (fernet | aesgcm | chacha20)
+REDIS_CIPHER = os.getenv("REDIS_CIPHER", "fernet")
+
 # Cache configuration
 CACHES = {
     "default": {
@@ -43,6 +46,7 @@ CACHES = {
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
             "COMPRESSOR": "django_redis.compressors.zlib.ZlibCompressor",
+            "CONNECTION_FACTORY": "services.redis.SharedConnectionFactory",
         },
     }
 }
@@ -50,6 +54,7 @@ CACHES = {
 # Security keys
 KEY = os.getenv("KEY")
 SECRET_KEY = KEY
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")  # Empty: /metrics/ Is Closed
 
 # External API keys
 
@@ -77,6 +82,9 @@ ADMIN_LOGIN_MOBILE = os.getenv("ADMIN_LOGIN_MOBILE")
 STATICFILES_DIRS = []
 STATIC_ROOT = os.path.join(BASE_DIR, "static")
 
+# Media files configuration (served by nginx's internal location)
+MEDIA_ACCEL_REDIRECT = os.getenv("MEDIA_ACCEL_REDIRECT", "true").lower() == "true"
+
 # Logging configuration
 LOG_DIR = "/var/log/project_title"
 
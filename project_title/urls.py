@@ -33,6 +33,8 @@ urlpatterns = [
     path(f"{ADMIN_PATH}/", movasa_admin_site.urls),
     # API endpoints
     path(f"{API_PREFIX}/auth/", include("apps.authentication.urls")),
+    # Monitoring endpoints
+    path("metrics/", include("manager.urls")),
 ]
 
 # Admin panel customization
@@ -6,6 +6,8 @@ import celery.signals as celery_signals
 from celery import Celery
 from project_title.log import logger_set
 
+from services.metrics import observe_task_end, observe_task_start
+
 logger = logger_set("services.celery")
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "project_title.settings")
@@ -52,6 +54,18 @@ def log_task_prerun(sender=None, task_id=None, task=None, args=None, kwargs=None
         )
 
 
+@celery_signals.task_prerun.connect
+def observe_task_prerun(sender=None, task_id=None, **kw):
+    if task_id:
+        observe_task_start(task_id)
+
+
+@celery_signals.task_postrun.connect
+def observe_task_postrun(sender=None, task_id=None, task=None, state=None, **kw):
+    if sender and task_id:
+        observe_task_end(task_id, get_task_name(sender, task), state or "UNKNOWN")
+
+
 @celery_signals.task_prerun.connect
 def save_task_name_prerun(
     sender=None, task_id=None, task=None, args=None, kwargs=None, **kw
@@ -0,0 +1,111 @@
+import os
+import time
+from typing import Dict, Optional, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+from CONSTANTS import (
+    METRICS_REDIS_BUCKETS,
+    METRICS_REQUEST_BUCKETS,
+    METRICS_TASK_BUCKETS,
+)
+
+# Gunicorn Workers And Celery Children Share mmap Files In This Directory
+MULTIPROCESS: bool = bool(os.getenv("PROMETHEUS_MULTIPROC_DIR"))
+
+# Processes Not Started By entrypoint.sh (Celery Containers, manage.py) Inherit The
+# Variable Without The Directory
+if MULTIPROCESS:
+    os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+http_requests_total: Counter = Counter(
+    "http_requests_total",
+    "HTTP requests by resolved view and status",
+    ["method", "view", "status"],
+)
+http_request_duration_seconds: Histogram = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by resolved view and status",
+    ["method", "view", "status"],
+    buckets=METRICS_REQUEST_BUCKETS,
+)
+redis_command_duration_seconds: Histogram = Histogram(
+    "redis_command_duration_seconds",
+    "Redis command latency (pipelines count as one PIPELINE call)",
+    ["command"],
+    buckets=METRICS_REDIS_BUCKETS,
+)
+redis_pool_connections: Gauge = Gauge(
+    "redis_pool_connections",
+    "Shared Redis connection pool usage",
+    ["state"],
+    multiprocess_mode="livesum",
+)
+celery_task_duration_seconds: Histogram = Histogram(
+    "celery_task_duration_seconds",
+    "Celery task run time by task and final state",
+    ["task", "state"],
+    buckets=METRICS_TASK_BUCKETS,
+)
+user_cache_events_total: Counter = Counter(
+    "user_cache_events_total",
+    "Authenticated user cache lookups and invalidations",
+    ["event"],
+)
+
+task_started_at: Dict[str, float] = {}
+
+
+def observe_request(method: str, view: str, status: int, duration: float) -> None:
+    http_requests_total.labels(method, view, status).inc()
+    http_request_duration_seconds.labels(method, view, status).observe(duration)
+
+
+def observe_redis(command: str, duration: float) -> None:
+    redis_command_duration_seconds.labels(command).observe(duration)
+
+
+def observe_redis_pool(stats: Dict[str, int]) -> None:
+    redis_pool_connections.labels("in_use").set(stats["in_use"])
+    redis_pool_connections.labels("idle").set(stats["idle"])
+
+
+def observe_user_cache(event: str, amount: int = 1) -> None:
+    user_cache_events_total.labels(event).inc(amount)
+
+
+def observe_task_start(task_id: str) -> None:
+    task_started_at[task_id] = time.perf_counter()
+
+
+def observe_task_end(task_id: str, task_name: str, state: str) -> None:
+    started: Optional[float] = task_started_at.pop(task_id, None)
+    if started is None:
+        return
+    celery_task_duration_seconds.labels(task_name, state).observe(
+        time.perf_counter() - started
+    )
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    if not MULTIPROCESS:
+        return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+    # Aggregate All Processes (Fresh Registry Per Scrape)
+    registry: CollectorRegistry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: int) -> None:
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(pid)
@@ -1,33 +1,289 @@
+import asyncio
 import json
+import struct
+import threading
+import time
 import uuid
-from typing import Optional, Any, Generator
+import weakref
+from contextlib import contextmanager, asynccontextmanager
+from typing import Optional, Any, AsyncGenerator, Generator, Tuple, List, Dict
 
 import redis
+import redis.asyncio as aredis
 import zstandard as zstd
-from cryptography.fernet import Fernet
-from project_title.settings import REDIS_SERVER, SECRET_KEY
+from django_redis.pool import ConnectionFactory
+from project_title.settings import REDIS_SERVER, REDIS_CIPHER, REDIS_POOL, SECRET_KEY
+from redis.backoff import ExponentialWithJitterBackoff
+from redis.commands.core import AsyncScript
+from redis.exceptions import ConnectionError, TimeoutError
+from redis.retry import Retry
+from redis.asyncio.retry import Retry as AsyncRetry
 
-from CONSTANTS import DAY
+from CONSTANTS import (
+    DAY,
+    REDIS_BATCH_SIZE,
+    REDIS_COMPRESS_MIN_SIZE,
+    ZSTD_DICTIONARY_KEY_PREFIX,
+    ZSTD_DICTIONARY_ACTIVE_KEY,
+    ZSTD_DICTIONARY_REFRESH_AGE,
+)
+from services.metrics import observe_redis
 from tools.datetimes import dt
+from tools.security import VersionedCipher
+from tools.timing import phase
 
+# Payload Frame Headers (Legacy Payloads Are Bare zstd Frames)
+FRAME_RAW: bytes = b"\x00"
+FRAME_ZSTD: bytes = b"\x01"
+FRAME_ZSTD_DICT: bytes = b"\x02"  # + 4-Byte Dictionary ID
+ZSTD_MAGIC: bytes = b"\x28\xb5\x2f\xfd"
 
-class RedisClient:
+# Atomic Counter: INCR + EXPIRE (On First Hit, Or Every Hit When Sliding)
+INCR_WITH_TTL_SCRIPT: str = """
+local count = redis.call("INCR", KEYS[1])
+if count == 1 or ARGV[2] == "1" then
+    redis.call("EXPIRE", KEYS[1], ARGV[1])
+end
+return count
+"""
+
+# Compare-And-Set: Write KEYS[1] Only While Counter KEYS[2] Still Equals ARGV[2]
+SET_IF_COUNTER_SCRIPT: str = """
+if (redis.call("GET", KEYS[2]) or "0") ~= ARGV[2] then
+    return 0
+end
+redis.call("SET", KEYS[1], ARGV[1], "EX", ARGV[3])
+return 1
+"""
+
+connection_pool_lock: threading.Lock = threading.Lock()
+connection_pool: Optional[redis.BlockingConnectionPool] = None
+
+
+# Async Pools Are Bound To The Event Loop That Opened Their Connections
+async_connection_pools: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _pool_options() -> Dict[str, Any]:
+    return {
+        "max_connections": REDIS_POOL["MAX_CONNECTIONS"],
+        "timeout": REDIS_POOL["POOL_TIMEOUT"],
+        "socket_timeout": REDIS_POOL["SOCKET_TIMEOUT"],
+        "socket_connect_timeout": REDIS_POOL["SOCKET_CONNECT_TIMEOUT"],
+        "socket_keepalive": REDIS_POOL["SOCKET_KEEPALIVE"],
+        "health_check_interval": REDIS_POOL["HEALTH_CHECK_INTERVAL"],
+        "retry_on_error": [ConnectionError, TimeoutError],
+    }
+
+
+def _pool_backoff() -> ExponentialWithJitterBackoff:
+    return ExponentialWithJitterBackoff(
+        cap=REDIS_POOL["RETRY_BACKOFF_CAP"], base=REDIS_POOL["RETRY_BACKOFF_BASE"]
+    )
+
+
+def get_connection_pool() -> redis.BlockingConnectionPool:
+    global connection_pool
+    if connection_pool is not None:
+        return connection_pool
+
+    with connection_pool_lock:
+        if connection_pool is None:
+            connection_pool = redis.BlockingConnectionPool.from_url(
+                REDIS_SERVER,
+                retry=Retry(_pool_backoff(), REDIS_POOL["RETRIES"]),
+                **_pool_options(),
+            )
+    return connection_pool
+
+
+def get_async_connection_pool() -> aredis.BlockingConnectionPool:
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    pool: Optional[aredis.BlockingConnectionPool] = async_connection_pools.get(loop)
+    if pool is None:
+        pool = aredis.BlockingConnectionPool.from_url(
+            REDIS_SERVER,
+            retry=AsyncRetry(_pool_backoff(), REDIS_POOL["RETRIES"]),
+            **_pool_options(),
+        )
+        async_connection_pools[loop] = pool
+    return pool
+
+
+class InstrumentedPipeline(redis.client.Pipeline):
+    def execute(self, raise_on_error: bool = True) -> List[Any]:
+        started: float = time.perf_counter()
+        try:
+            return super().execute(raise_on_error)
+        finally:
+            observe_redis("PIPELINE", time.perf_counter() - started)
+
+
+class InstrumentedRedis(redis.Redis):
+    # Command Latency Metrics For Every Call Made Through The Shared Pool
+    def execute_command(self, *args: Any, **options: Any) -> Any:
+        started: float = time.perf_counter()
+        try:
+            return super().execute_command(*args, **options)
+        finally:
+            observe_redis(str(args[0]), time.perf_counter() - started)
+
+    def pipeline(
+        self, transaction: bool = True, shard_hint: Optional[str] = None
+    ) -> InstrumentedPipeline:
+        return InstrumentedPipeline(
+            self.connection_pool, self.response_callbacks, transaction, shard_hint
+        )
+
+
+class AsyncInstrumentedPipeline(aredis.client.Pipeline):
+    async def execute(self, raise_on_error: bool = True) -> List[Any]:
+        started: float = time.perf_counter()
+        try:
+            return await super().execute(raise_on_error)
+        finally:
+            observe_redis("PIPELINE", time.perf_counter() - started)
+
+
+class AsyncInstrumentedRedis(aredis.Redis):
+    async def execute_command(self, *args: Any, **options: Any) -> Any:
+        started: float = time.perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            observe_redis(str(args[0]), time.perf_counter() - started)
+
+    def pipeline(
+        self, transaction: bool = True, shard_hint: Optional[str] = None
+    ) -> AsyncInstrumentedPipeline:
+        return AsyncInstrumentedPipeline(
+            self.connection_pool, self.response_callbacks, transaction, shard_hint
+        )
+
+
+def get_redis_connection() -> redis.Redis:
+    return InstrumentedRedis(connection_pool=get_connection_pool())
+
+
+def get_async_redis_connection() -> aredis.Redis:
+    return AsyncInstrumentedRedis(connection_pool=get_async_connection_pool())
+
+
+def get_pool_stats() -> Dict[str, int]:
+    pool: redis.BlockingConnectionPool = get_connection_pool()
+    created: int = len(pool._connections)
+    idle: int = sum(1 for c in list(pool.pool.queue) if c is not None)
+    return {
+        "max_connections": pool.max_connections,
+        "created": created,
+        "in_use": created - idle,
+        "idle": idle,
+    }
+
+
+def is_redis_healthy() -> bool:
+    try:
+        return bool(get_redis_connection().ping())
+    except (ConnectionError, TimeoutError):
+        return False
+
+
+class SharedConnectionFactory(ConnectionFactory):
+    # Let django_redis Reuse The Shared Pool For REDIS_SERVER
+    def get_or_create_connection_pool(self, params: dict) -> redis.ConnectionPool:
+        if params["url"] == REDIS_SERVER:
+            return get_connection_pool()
+        return super().get_or_create_connection_pool(params)
+
+
+DictionaryPair = Tuple[zstd.ZstdCompressor, zstd.ZstdDecompressor]
+
+
+class RedisCodec:
+    # Shared Payload Envelope (No I/O): Frame -> Compress -> Encrypt
     DEFAULT_EXPIRE: int = DAY
-    client: redis.Redis
-    cipher: Fernet
+    cipher: VersionedCipher
     COMPRESS_LEVEL: int = 3
+    COMPRESS_MIN_SIZE: int = REDIS_COMPRESS_MIN_SIZE
 
     def __init__(self) -> None:
-        self.client = redis.StrictRedis.from_url(REDIS_SERVER)
-        self.cipher = Fernet(SECRET_KEY)
+        self.cipher = VersionedCipher(key=SECRET_KEY, name=REDIS_CIPHER)
         self.compressor = zstd.ZstdCompressor(level=self.COMPRESS_LEVEL)
         self.decompressor = zstd.ZstdDecompressor()
+        self.dictionaries: Dict[int, DictionaryPair] = {}
+        self.active_dictionary_id: Optional[int] = None
+        # Check The Active Dictionary On First Use
+        self.dictionary_checked_at: float = -ZSTD_DICTIONARY_REFRESH_AGE
+
+    # 1. Compression Dictionaries
+
+    def _dictionary_key(self, dictionary_id: int) -> str:
+        return "{}{}".format(ZSTD_DICTIONARY_KEY_PREFIX, dictionary_id)
+
+    def _build_dictionary(self, dictionary_id: int, blob: bytes) -> DictionaryPair:
+        dictionary = zstd.ZstdCompressionDict(self.cipher.decrypt(blob))
+        pair: DictionaryPair = (
+            zstd.ZstdCompressor(
+                level=self.COMPRESS_LEVEL, dict_data=dictionary, write_dict_id=False
+            ),
+            zstd.ZstdDecompressor(dict_data=dictionary),
+        )
+        self.dictionaries[dictionary_id] = pair
+        return pair
+
+    def _should_check_dictionary(self) -> bool:
+        # Re-Check The Active Dictionary Periodically
+        now: float = time.monotonic()
+        if now - self.dictionary_checked_at > ZSTD_DICTIONARY_REFRESH_AGE:
+            self.dictionary_checked_at = now
+            return True
+        return False
+
+    def _set_active_dictionary(self, active: Optional[bytes]) -> None:
+        self.active_dictionary_id = int(active) if active else None
+
+    # 2. Framing
 
-    def _encode(self, raw: bytes) -> bytes:
-        return self.cipher.encrypt(self.compressor.compress(raw))
+    def _frame(
+        self, raw: bytes, active: Optional[Tuple[int, zstd.ZstdCompressor]] = None
+    ) -> bytes:
+        # Trained Dictionary (Small, Repetitive Payloads)
+        if active:
+            dictionary_id, compressor = active
+            compressed: bytes = compressor.compress(raw)
+            if len(compressed) + 4 < len(raw):
+                return FRAME_ZSTD_DICT + struct.pack(">I", dictionary_id) + compressed
 
-    def _decode(self, blob: bytes) -> bytes:
-        return self.decompressor.decompress(self.cipher.decrypt(blob))
+        # Skip Compression For Small Or Incompressible Values
+        if len(raw) >= self.COMPRESS_MIN_SIZE:
+            compressed = self.compressor.compress(raw)
+            if len(compressed) < len(raw):
+                return FRAME_ZSTD + compressed
+        return FRAME_RAW + raw
+
+    @staticmethod
+    def _frame_dictionary_id(payload: bytes) -> Optional[int]:
+        if payload[:1] != FRAME_ZSTD_DICT:
+            return None
+        return struct.unpack(">I", payload[1:5])[0]
+
+    def _unframe(self, payload: bytes, pair: Optional[DictionaryPair] = None) -> bytes:
+        header: bytes = payload[:1]
+        if header == FRAME_RAW:
+            return payload[1:]
+        if header == FRAME_ZSTD:
+            return self.decompressor.decompress(payload[1:])
+        if header == FRAME_ZSTD_DICT:
+            if pair is None:
+                raise ValueError(
+                    "Unknown dictionary: {}".format(self._frame_dictionary_id(payload))
+                )
+            return pair[1].decompress(payload[5:])
+        if payload.startswith(ZSTD_MAGIC):
+            return self.decompressor.decompress(payload)
+        raise ValueError("Unknown payload frame: {!r}".format(header))
+
+    # 3. Serialization
 
     @staticmethod
     def _serializer(obj: Any) -> str:
@@ -37,6 +293,87 @@ class RedisClient:
             return obj.isoformat()
         raise TypeError("Type {} not serializable".format(type(obj)))
 
+    def _dump_json(self, value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False, default=self._serializer).encode(
+            "utf-8"
+        )
+
+    @staticmethod
+    def _load_json(raw: bytes) -> Any:
+        return json.loads(raw.decode("utf-8"))
+
+
+class RedisClient(RedisCodec):
+    DEFAULT_EXPIRE: int = RedisCodec.DEFAULT_EXPIRE
+    client: redis.Redis
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.client = get_redis_connection()
+        self.incr_with_ttl_script = self.client.register_script(INCR_WITH_TTL_SCRIPT)
+        self.set_if_counter_script = self.client.register_script(SET_IF_COUNTER_SCRIPT)
+
+    # 1. Compression Dictionaries
+
+    def _load_dictionary(self, dictionary_id: int) -> Optional[DictionaryPair]:
+        if dictionary_id in self.dictionaries:
+            return self.dictionaries[dictionary_id]
+
+        blob: Optional[bytes] = self.client.get(self._dictionary_key(dictionary_id))
+        if blob is None:
+            return None
+        return self._build_dictionary(dictionary_id, blob)
+
+    def _active_dictionary(
+        self,
+    ) -> Optional[Tuple[int, zstd.ZstdCompressor]]:
+        if self._should_check_dictionary():
+            self._set_active_dictionary(self.client.get(ZSTD_DICTIONARY_ACTIVE_KEY))
+
+        if self.active_dictionary_id is None:
+            return None
+
+        pair = self._load_dictionary(self.active_dictionary_id)
+        if pair is None:
+            return None
+        return self.active_dictionary_id, pair[0]
+
+    def save_dictionary(
+        self, dictionary: zstd.ZstdCompressionDict, activate: bool = True
+    ) -> int:
+        dictionary_id: int = dictionary.dict_id()
+        self.client.set(
+            self._dictionary_key(dictionary_id),
+            self.cipher.encrypt(dictionary.as_bytes()),
+        )
+        if activate:
+            self.client.set(ZSTD_DICTIONARY_ACTIVE_KEY, str(dictionary_id))
+            self.active_dictionary_id = dictionary_id
+            self.dictionary_checked_at = time.monotonic()
+        return dictionary_id
+
+    # 2. Encoding
+
+    def _compress(self, raw: bytes, use_dictionary: bool = False) -> bytes:
+        return self._frame(raw, self._active_dictionary() if use_dictionary else None)
+
+    def _decompress(self, payload: bytes) -> Optional[bytes]:
+        dictionary_id: Optional[int] = self._frame_dictionary_id(payload)
+        if dictionary_id is None:
+            return self._unframe(payload)
+
+        # Dictionary Evicted Or Flushed: Treat The Value As A Cache Miss
+        pair: Optional[DictionaryPair] = self._load_dictionary(dictionary_id)
+        if pair is None:
+            return None
+        return self._unframe(payload, pair)
+
+    def _encode(self, raw: bytes, use_dictionary: bool = False) -> bytes:
+        return self.cipher.encrypt(self._compress(raw, use_dictionary))
+
+    def _decode(self, blob: bytes) -> Optional[bytes]:
+        return self._decompress(self.cipher.decrypt(blob))
+
     def set_string(self, key: str, value: str, expire: int = DEFAULT_EXPIRE) -> None:
         raw: bytes = value.encode("utf-8")
         blob: bytes = self._encode(raw)
@@ -46,22 +383,64 @@ class RedisClient:
         blob: Optional[bytes] = self.client.get(key)
         if blob is None:
             return None
-        raw: bytes = self._decode(blob)
+        raw: Optional[bytes] = self._decode(blob)
+        if raw is None:
+            return None
         return raw.decode("utf-8")
 
-    def set_json(self, key: str, value: Any, expire: int = DEFAULT_EXPIRE) -> None:
-        raw: bytes = json.dumps(
-            value, ensure_ascii=False, default=self._serializer
-        ).encode("utf-8")
-        blob: bytes = self._encode(raw)
+    def set_json(
+        self,
+        key: str,
+        value: Any,
+        expire: int = DEFAULT_EXPIRE,
+        use_dictionary: bool = False,
+    ) -> None:
+        raw: bytes = self._dump_json(value)
+        blob: bytes = self._encode(raw, use_dictionary)
         self.client.set(name=key, value=blob, ex=expire)
 
+    def set_json_if_counter(
+        self,
+        key: str,
+        value: Any,
+        counter_key: str,
+        counter: int,
+        expire: int = DEFAULT_EXPIRE,
+    ) -> bool:
+        # Skipped When counter_key Moved Since counter Was Read (See get_counter)
+        blob: bytes = self._encode(self._dump_json(value))
+        return bool(
+            self.set_if_counter_script(
+                keys=[key, counter_key],
+                args=[blob, counter, expire],
+                client=self.client,
+            )
+        )
+
     def get_json(self, key: str) -> Optional[Any]:
-        blob: Optional[bytes] = self.client.get(key)
+        with phase("redis"):
+            blob: Optional[bytes] = self.client.get(key)
         if blob is None:
             return None
-        raw: bytes = self._decode(blob)
-        return json.loads(raw.decode("utf-8"))
+        with phase("redis-decode"):
+            raw: Optional[bytes] = self._decode(blob)
+            if raw is None:
+                return None
+            return self._load_json(raw)
+
+    def get_json_with_ttl(self, key: str) -> Tuple[Optional[Any], Optional[int]]:
+        with phase("redis"):
+            pipe = self.client.pipeline(transaction=False)
+            pipe.get(key)
+            pipe.ttl(key)
+            blob, ttl = pipe.execute()
+        if blob is None:
+            return None, None
+        with phase("redis-decode"):
+            raw: Optional[bytes] = self._decode(blob)
+            if raw is None:
+                return None, None
+            return self._load_json(raw), ttl
 
     def set_int(self, key: str, value: int, expire: int = DEFAULT_EXPIRE) -> None:
         raw: bytes = str(value).encode("utf-8")
@@ -72,19 +451,106 @@ class RedisClient:
         blob: Optional[bytes] = self.client.get(key)
         if blob is None:
             return None
-        raw: bytes = self._decode(blob)
+        raw: Optional[bytes] = self._decode(blob)
+        if raw is None:
+            return None
         return int(raw.decode("utf-8"))
 
+    # Plain Counters (Not Encrypted, Non-Secret Values Only)
+
+    def incr_with_ttl(
+        self, key: str, expire: int = DEFAULT_EXPIRE, sliding: bool = False
+    ) -> int:
+        count: int = self.incr_with_ttl_script(
+            keys=[key], args=[expire, "1" if sliding else "0"], client=self.client
+        )
+        return int(count)
+
+    def get_counter(self, key: str) -> int:
+        value: Optional[bytes] = self.client.get(key)
+        if value is None:
+            return 0
+        return int(value)
+
+    def _mget_raw(self, keys: List[str]) -> List[Optional[bytes]]:
+        if not keys:
+            return []
+        blobs: List[Optional[bytes]] = self.client.mget(keys)
+        return [None if blob is None else self._decode(blob) for blob in blobs]
+
+    def mget_string(self, keys: List[str]) -> List[Optional[str]]:
+        return [
+            None if raw is None else raw.decode("utf-8") for raw in self._mget_raw(keys)
+        ]
+
+    def mget_json(self, keys: List[str]) -> List[Optional[Any]]:
+        return [
+            None if raw is None else self._load_json(raw)
+            for raw in self._mget_raw(keys)
+        ]
+
+    def mget_int(self, keys: List[str]) -> List[Optional[int]]:
+        return [
+            None if raw is None else int(raw.decode("utf-8"))
+            for raw in self._mget_raw(keys)
+        ]
+
+    def mset_string(
+        self,
+        mapping: Dict[str, str],
+        expire: int = DEFAULT_EXPIRE,
+        expires: Optional[Dict[str, int]] = None,
+    ) -> None:
+        expires = expires or {}
+        with self.pipeline() as pipe:
+            for key, value in mapping.items():
+                pipe.set_string(key, value, expires.get(key, expire))
+
+    def mset_json(
+        self,
+        mapping: Dict[str, Any],
+        expire: int = DEFAULT_EXPIRE,
+        expires: Optional[Dict[str, int]] = None,
+    ) -> None:
+        expires = expires or {}
+        with self.pipeline() as pipe:
+            for key, value in mapping.items():
+                pipe.set_json(key, value, expires.get(key, expire))
+
+    def mset_int(
+        self,
+        mapping: Dict[str, int],
+        expire: int = DEFAULT_EXPIRE,
+        expires: Optional[Dict[str, int]] = None,
+    ) -> None:
+        expires = expires or {}
+        with self.pipeline() as pipe:
+            for key, value in mapping.items():
+                pipe.set_int(key, value, expires.get(key, expire))
+
+    @contextmanager
+    def pipeline(self) -> Generator["RedisPipeline", None, None]:
+        pipe: RedisPipeline = RedisPipeline(self)
+        try:
+            yield pipe
+        except Exception:
+            pipe.reset()
+            raise
+        pipe.execute()
+
     def delete(self, key: str) -> None:
         self.client.delete(key)
 
+    def expire(self, key: str, expire: int = DEFAULT_EXPIRE) -> bool:
+        return bool(self.client.expire(name=key, time=expire))
+
     def get_keys_by_prefix(self, prefix: str) -> Generator[bytes, None, None]:
         all_keys: set = set()
         cursor: int = 0
 
         while True:
             cursor, keys = self.client.scan(
-                cursor=cursor, match="{}*".format(prefix), count=100
+                cursor=cursor, match="{}*".format(prefix), count=REDIS_BATCH_SIZE
             )
             for key in keys:
                 # Handle Redis scan duplicates
@@ -96,5 +562,359 @@ class RedisClient:
                 break
 
 
+class RedisPipeline:
+    DEFAULT_EXPIRE: int = RedisCodec.DEFAULT_EXPIRE
+
+    def __init__(self, redis_client: RedisClient) -> None:
+        self.redis_client: RedisClient = redis_client
+        self.pipe = redis_client.client.pipeline(transaction=False)
+
+    def set_string(
+        self, key: str, value: str, expire: int = DEFAULT_EXPIRE
+    ) -> "RedisPipeline":
+        blob: bytes = self.redis_client._encode(value.encode("utf-8"))
+        self.pipe.set(name=key, value=blob, ex=expire)
+        return self
+
+    def set_json(
+        self,
+        key: str,
+        value: Any,
+        expire: int = DEFAULT_EXPIRE,
+        use_dictionary: bool = False,
+    ) -> "RedisPipeline":
+        raw: bytes = self.redis_client._dump_json(value)
+        blob: bytes = self.redis_client._encode(raw, use_dictionary)
+        self.pipe.set(name=key, value=blob, ex=expire)
+        return self
+
+    def set_int(
+        self, key: str, value: int, expire: int = DEFAULT_EXPIRE
+    ) -> "RedisPipeline":
+        blob: bytes = self.redis_client._encode(str(value).encode("utf-8"))
+        self.pipe.set(name=key, value=blob, ex=expire)
+        return self
+
+    def delete(self, key: str) -> "RedisPipeline":
+        self.pipe.delete(key)
+        return self
+
+    def expire(self, key: str, expire: int = DEFAULT_EXPIRE) -> "RedisPipeline":
+        self.pipe.expire(name=key, time=expire)
+        return self
+
+    def execute(self) -> List[Any]:
+        return self.pipe.execute()
+
+    def reset(self) -> None:
+        self.pipe.reset()
+
+    def __len__(self) -> int:
+        return len(self.pipe)
+
+
+class AsyncRedisClient(RedisCodec):
+    # Same Envelope And API As RedisClient, For ASGI Code Paths
+    DEFAULT_EXPIRE: int = RedisCodec.DEFAULT_EXPIRE
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Client Passed Per Call (Pools Are Per Event Loop); SHA Computed Once
+        self.incr_with_ttl_script: AsyncScript = AsyncScript(
+            None, INCR_WITH_TTL_SCRIPT.encode("utf-8")
+        )
+        self.set_if_counter_script: AsyncScript = AsyncScript(
+            None, SET_IF_COUNTER_SCRIPT.encode("utf-8")
+        )
+
+    @property
+    def client(self) -> aredis.Redis:
+        return get_async_redis_connection()
+
+    # 1. Compression Dictionaries
+
+    async def _load_dictionary(self, dictionary_id: int) -> Optional[DictionaryPair]:
+        if dictionary_id in self.dictionaries:
+            return self.dictionaries[dictionary_id]
+
+        blob: Optional[bytes] = await self.client.get(
+            self._dictionary_key(dictionary_id)
+        )
+        if blob is None:
+            return None
+        return self._build_dictionary(dictionary_id, blob)
+
+    async def _active_dictionary(
+        self,
+    ) -> Optional[Tuple[int, zstd.ZstdCompressor]]:
+        if self._should_check_dictionary():
+            self._set_active_dictionary(
+                await self.client.get(ZSTD_DICTIONARY_ACTIVE_KEY)
+            )
+
+        if self.active_dictionary_id is None:
+            return None
+
+        pair = await self._load_dictionary(self.active_dictionary_id)
+        if pair is None:
+            return None
+        return self.active_dictionary_id, pair[0]
+
+    # 2. Encoding
+
+    async def _compress(self, raw: bytes, use_dictionary: bool = False) -> bytes:
+        active = await self._active_dictionary() if use_dictionary else None
+        return self._frame(raw, active)
+
+    async def _decompress(self, payload: bytes) -> Optional[bytes]:
+        dictionary_id: Optional[int] = self._frame_dictionary_id(payload)
+        if dictionary_id is None:
+            return self._unframe(payload)
+
+        # Dictionary Evicted Or Flushed: Treat The Value As A Cache Miss
+        pair: Optional[DictionaryPair] = await self._load_dictionary(dictionary_id)
+        if pair is None:
+            return None
+        return self._unframe(payload, pair)
+
+    async def _encode(self, raw: bytes, use_dictionary: bool = False) -> bytes:
+        return self.cipher.encrypt(await self._compress(raw, use_dictionary))
+
+    async def _decode(self, blob: bytes) -> Optional[bytes]:
+        return await self._decompress(self.cipher.decrypt(blob))
+
+    async def set_string(
+        self, key: str, value: str, expire: int = DEFAULT_EXPIRE
+    ) -> None:
+        blob: bytes = await self._encode(value.encode("utf-8"))
+        await self.client.set(name=key, value=blob, ex=expire)
+
+    async def get_string(self, key: str) -> Optional[str]:
+        blob: Optional[bytes] = await self.client.get(key)
+        if blob is None:
+            return None
+        raw: Optional[bytes] = await self._decode(blob)
+        if raw is None:
+            return None
+        return raw.decode("utf-8")
+
+    async def set_json(
+        self,
+        key: str,
+        value: Any,
+        expire: int = DEFAULT_EXPIRE,
+        use_dictionary: bool = False,
+    ) -> None:
+        blob: bytes = await self._encode(self._dump_json(value), use_dictionary)
+        await self.client.set(name=key, value=blob, ex=expire)
+
+    async def set_json_if_counter(
+        self,
+        key: str,
+        value: Any,
+        counter_key: str,
+        counter: int,
+        expire: int = DEFAULT_EXPIRE,
+    ) -> bool:
+        blob: bytes = await self._encode(self._dump_json(value))
+        return bool(
+            await self.set_if_counter_script(
+                keys=[key, counter_key],
+                args=[blob, counter, expire],
+                client=self.client,
+            )
+        )
+
+    async def get_json(self, key: str) -> Optional[Any]:
+        with phase("redis"):
+            blob: Optional[bytes] = await self.client.get(key)
+        if blob is None:
+            return None
+        with phase("redis-decode"):
+            raw: Optional[bytes] = await self._decode(blob)
+            if raw is None:
+                return None
+            return self._load_json(raw)
+
+    async def get_json_with_ttl(self, key: str) -> Tuple[Optional[Any], Optional[int]]:
+        with phase("redis"):
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.get(key)
+                pipe.ttl(key)
+                blob, ttl = await pipe.execute()
+        if blob is None:
+            return None, None
+        with phase("redis-decode"):
+            raw: Optional[bytes] = await self._decode(blob)
+            if raw is None:
+                return None, None
+            return self._load_json(raw), ttl
+
+    async def set_int(self, key: str, value: int, expire: int = DEFAULT_EXPIRE) -> None:
+        blob: bytes = await self._encode(str(value).encode("utf-8"))
+        await self.client.set(name=key, value=blob, ex=expire)
+
+    async def get_int(self, key: str) -> Optional[int]:
+        blob: Optional[bytes] = await self.client.get(key)
+        if blob is None:
+            return None
+        raw: Optional[bytes] = await self._decode(blob)
+        if raw is None:
+            return None
+        return int(raw.decode("utf-8"))
+
+    # Plain Counters (Not Encrypted, Non-Secret Values Only)
+
+    async def incr_with_ttl(
+        self, key: str, expire: int = DEFAULT_EXPIRE, sliding: bool = False
+    ) -> int:
+        count: int = await self.incr_with_ttl_script(
+            keys=[key], args=[expire, "1" if sliding else "0"], client=self.client
+        )
+        return int(count)
+
+    async def get_counter(self, key: str) -> int:
+        value: Optional[bytes] = await self.client.get(key)
+        if value is None:
+            return 0
+        return int(value)
+
+    async def _mget_raw(self, keys: List[str]) -> List[Optional[bytes]]:
+        if not keys:
+            return []
+        blobs: List[Optional[bytes]] = await self.client.mget(keys)
+        return [None if blob is None else await self._decode(blob) for blob in blobs]
+
+    async def mget_string(self, keys: List[str]) -> List[Optional[str]]:
+        return [
+            None if raw is None else raw.decode("utf-8")
+            for raw in await self._mget_raw(keys)
+        ]
+
+    async def mget_json(self, keys: List[str]) -> List[Optional[Any]]:
+        return [
+            None if raw is None else self._load_json(raw)
+            for raw in await self._mget_raw(keys)
+        ]
+
+    async def mget_int(self, keys: List[str]) -> List[Optional[int]]:
+        return [
+            None if raw is None else int(raw.decode("utf-8"))
+            for raw in await self._mget_raw(keys)
+        ]
+
+    async def mset_string(
+        self,
+        mapping: Dict[str, str],
+        expire: int = DEFAULT_EXPIRE,
+        expires: Optional[Dict[str, int]] = None,
+    ) -> None:
+        expires = expires or {}
+        async with self.pipeline() as pipe:
+            for key, value in mapping.items():
+                await pipe.set_string(key, value, expires.get(key, expire))
+
+    async def mset_json(
+        self,
+        mapping: Dict[str, Any],
+        expire: int = DEFAULT_EXPIRE,
+        expires: Optional[Dict[str, int]] = None,
+    ) -> None:
+        expires = expires or {}
+        async with self.pipeline() as pipe:
+            for key, value in mapping.items():
+                await pipe.set_json(key, value, expires.get(key, expire))
+
+    async def mset_int(
+        self,
+        mapping: Dict[str, int],
+        expire: int = DEFAULT_EXPIRE,
+        expires: Optional[Dict[str, int]] = None,
+    ) -> None:
+        expires = expires or {}
+        async with self.pipeline() as pipe:
+            for key, value in mapping.items():
+                await pipe.set_int(key, value, expires.get(key, expire))
+
+    @asynccontextmanager
+    async def pipeline(self) -> AsyncGenerator["AsyncRedisPipeline", None]:
+        pipe: AsyncRedisPipeline = AsyncRedisPipeline(self)
+        try:
+            yield pipe
+        except Exception:
+            await pipe.reset()
+            raise
+        await pipe.execute()
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(key)
+
+    async def expire(self, key: str, expire: int = DEFAULT_EXPIRE) -> bool:
+        return bool(await self.client.expire(name=key, time=expire))
+
+    async def get_keys_by_prefix(self, prefix: str) -> AsyncGenerator[bytes, None]:
+        all_keys: set = set()
+        async for key in self.client.scan_iter(
+            match="{}*".format(prefix), count=REDIS_BATCH_SIZE
+        ):
+            # Handle Redis scan duplicates
+            if key in all_keys:
+                continue
+            all_keys.add(key)
+            yield key
+
+
+class AsyncRedisPipeline:
+    DEFAULT_EXPIRE: int = RedisCodec.DEFAULT_EXPIRE
+
+    def __init__(self, redis_client: AsyncRedisClient) -> None:
+        self.redis_client: AsyncRedisClient = redis_client
+        self.pipe = redis_client.client.pipeline(transaction=False)
+
+    async def set_string(
+        self, key: str, value: str, expire: int = DEFAULT_EXPIRE
+    ) -> "AsyncRedisPipeline":
+        blob: bytes = await self.redis_client._encode(value.encode("utf-8"))
+        self.pipe.set(name=key, value=blob, ex=expire)
+        return self
+
+    async def set_json(
+        self,
+        key: str,
+        value: Any,
+        expire: int = DEFAULT_EXPIRE,
+        use_dictionary: bool = False,
+    ) -> "AsyncRedisPipeline":
+        raw: bytes = self.redis_client._dump_json(value)
+        blob: bytes = await self.redis_client._encode(raw, use_dictionary)
+        self.pipe.set(name=key, value=blob, ex=expire)
+        return self
+
+    async def set_int(
+        self, key: str, value: int, expire: int = DEFAULT_EXPIRE
+    ) -> "AsyncRedisPipeline":
+        blob: bytes = await self.redis_client._encode(str(value).encode("utf-8"))
+        self.pipe.set(name=key, value=blob, ex=expire)
+        return self
+
+    def delete(self, key: str) -> "AsyncRedisPipeline":
+        self.pipe.delete(key)
+        return self
+
+    def expire(self, key: str, expire: int = DEFAULT_EXPIRE) -> "AsyncRedisPipeline":
+        self.pipe.expire(name=key, time=expire)
+        return self
+
+    async def execute(self) -> List[Any]:
+        return await self.pipe.execute()
+
+    async def reset(self) -> None:
+        await self.pipe.reset()
+
+    def __len__(self) -> int:
+        return len(self.pipe)
+
+
 # Global Redis client instance
 redis_client: RedisClient = RedisClient()
+async_redis_client: AsyncRedisClient = AsyncRedisClient()
@@ -1,5 +1,18 @@
+from unittest import mock
+
+from django.test import RequestFactory
 from django.urls import reverse
 
+from CONSTANTS import MAX_UNSUCCESSFUL_LOGIN_COUNT, USER_SNAPSHOT_KEY_PREFIX
+from services.redis import async_redis_client, redis_client
+from utils.permissions import AuthenticationError, TokenAuthentication
+from utils.session import (
+    aget_cached_user,
+    get_cached_user,
+    invalidate_user_cache,
+    user_cache,
+    user_cache_stats,
+)
 from utils.test import *
 
 
@@ -134,3 +147,132 @@ class PasswordTests(WebAppAPITestCase):
 
     def test_cases_run(self):
         self.run_tests()
+
+
+class UserCacheTests(WebAppAPITestCase):
+    base_url = reverse("authentication:main")
+    test_cases: list[APITestCasePack] = []
+
+    def setUp(self):
+        self.base_setUp()
+
+    def test_cached_user_info(self):
+        # Warm Up Snapshot
+        self.client.get(self.base_url, HTTP_AUTHORIZATION=self.auth_token)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(
+                self.base_url, HTTP_AUTHORIZATION=self.auth_token
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["mobile"], self.user.mobile)
+
+    def test_snapshot_invalidated_on_update(self):
+        self.client.get(self.base_url, HTTP_AUTHORIZATION=self.auth_token)
+        self.client.put(
+            self.base_url, {"name": "علی رضایی"}, HTTP_AUTHORIZATION=self.auth_token
+        )
+
+        response = self.client.get(self.base_url, HTTP_AUTHORIZATION=self.auth_token)
+        self.assertEqual(response.data["name"], "علی رضایی")
+
+    def test_snapshot_not_written_after_racing_invalidation(self):
+        invalidate_user_cache(self.user.pk)
+        get_counter = redis_client.get_counter
+
+        # A Save Commits (And Invalidates) While The Miss Is Reading The Database
+        def racing_get_counter(key: str) -> int:
+            generation: int = get_counter(key)
+            invalidate_user_cache(self.user.pk)
+            return generation
+
+        with mock.patch.object(redis_client, "get_counter", racing_get_counter):
+            self.assertEqual(get_cached_user(self.user.pk).pk, self.user.pk)
+        self.assertIsNone(
+            redis_client.get_json("{}{}".format(USER_SNAPSHOT_KEY_PREFIX, self.user.pk))
+        )
+
+        # Next Miss Writes Normally
+        user_cache.delete(self.user.pk)
+        get_cached_user(self.user.pk)
+        self.assertIsNotNone(
+            redis_client.get_json("{}{}".format(USER_SNAPSHOT_KEY_PREFIX, self.user.pk))
+        )
+
+
+class UnsuccessfulLoginLimitTests(WebAppAPITestCase):
+    base_url = reverse("authentication:main")
+    test_cases: list[APITestCasePack] = []
+
+    def setUp(self):
+        self.base_setUp()
+
+    def test_user_deactivated_after_limit(self):
+        for _ in range(MAX_UNSUCCESSFUL_LOGIN_COUNT):
+            response = self.client.post(
+                self.base_url,
+                {"mobile": self.user.mobile, "verification_code": "00000"},
+            )
+            self.assertEqual(response.status_code, 400)
+
+        self.user.refresh_from_db()
+        self.assertFalse(self.user.is_active)
+
+
+class AsyncAuthenticationTests(WebAppAPITestCase):
+    base_url = reverse("authentication:main")
+    test_cases: list[APITestCasePack] = []
+
+    def setUp(self):
+        self.base_setUp()
+
+    async def test_aauthenticate(self):
+        request = RequestFactory().get(
+            self.base_url, HTTP_AUTHORIZATION=self.auth_token
+        )
+        user, token = await TokenAuthentication().aauthenticate(request)
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertEqual(request.user.pk, self.user.pk)
+        self.assertEqual("Bearer {}".format(token), self.auth_token)
+
+        # No Header -> Anonymous, Unknown Token -> 401
+        self.assertIsNone(
+            await TokenAuthentication().aauthenticate(
+                RequestFactory().get(self.base_url)
+            )
+        )
+        request = RequestFactory().get(
+            self.base_url, HTTP_AUTHORIZATION="Bearer invalid"
+        )
+        with self.assertRaises(AuthenticationError):
+            await TokenAuthentication().aauthenticate(request)
+
+    async def test_aget_cached_user(self):
+        # Database First, Then The Redis Snapshot Once The Local Copy Is Gone
+        user_cache.delete(self.user.pk)
+        await async_redis_client.delete(
+            key="{}{}".format(USER_SNAPSHOT_KEY_PREFIX, self.user.pk)
+        )
+        user_cache_stats.reset()
+
+        self.assertEqual(
+            (await aget_cached_user(self.user.pk)).mobile, self.user.mobile
+        )
+        user_cache.delete(self.user.pk)
+        self.assertEqual(
+            (await aget_cached_user(self.user.pk)).mobile, self.user.mobile
+        )
+        self.assertEqual(
+            (await aget_cached_user(self.user.pk)).mobile, self.user.mobile
+        )
+
+        stats: dict = user_cache_stats.snapshot()
+        self.assertEqual(
+            (stats["miss"], stats["redis_hit"], stats["local_hit"]), (1, 1, 1)
+        )
+
+    async def test_async_counter(self):
+        key: str = "test-async-counter"
+        self.assertEqual(await async_redis_client.incr_with_ttl(key, expire=60), 1)
+        self.assertEqual(await async_redis_client.incr_with_ttl(key, expire=60), 2)
+        await async_redis_client.delete(key)
@@ -0,0 +1,130 @@
+import io
+import shutil
+import tempfile
+
+from django.core.management import CommandError, call_command
+from django.test import override_settings
+from django.urls import reverse
+from project_title.settings import METRICS_TOKEN, SECRET_KEY
+
+from CONSTANTS import PROFILE_TRIGGER_HEADER
+from manager.models import RequestProfile
+from tools.security import create_token
+from utils.middlewares import profile_lock
+from utils.test import *
+
+
+class MetricsTests(WebAppAPITestCase):
+    base_url = reverse("manager:metrics")
+    test_cases: list[APITestCasePack] = []
+
+    def setUp(self):
+        self.base_setUp()
+
+    def test_metrics_requires_token(self):
+        response = self.client.get(self.base_url)
+        self.assertEqual(response.status_code, 403)
+
+        # Session Tokens Are Not Accepted
+        response = self.client.get(self.base_url, HTTP_AUTHORIZATION=self.auth_token)
+        self.assertEqual(response.status_code, 403)
+
+    def test_metrics_exposition(self):
+        self.client.get(
+            reverse("authentication:main"), HTTP_AUTHORIZATION=self.auth_token
+        )
+
+        response = self.client.get(
+            self.base_url, HTTP_AUTHORIZATION="Bearer {}".format(METRICS_TOKEN)
+        )
+        self.assertEqual(response.status_code, 200)
+
+        body: str = response.content.decode("utf-8")
+        self.assertIn('view="authentication:main"', body)
+        self.assertIn("http_request_duration_seconds_bucket", body)
+        self.assertIn("redis_command_duration_seconds_bucket", body)
+        self.assertIn("user_cache_events_total", body)
+
+
+class ProfilingTests(WebAppAPITestCase):
+    base_url = reverse("authentication:main")
+    test_cases: list[APITestCasePack] = []
+
+    def setUp(self):
+        self.base_setUp()
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+
+    def test_profile_requires_signed_header(self):
+        with override_settings(MEDIA_ROOT=self.media_root):
+            self.client.get(self.base_url, HTTP_AUTHORIZATION=self.auth_token)
+
+            # Other Signed Tokens (e.g. Password Permission) Are Not Accepted
+            response = self.client.get(
+                self.base_url,
+                HTTP_AUTHORIZATION=self.auth_token,
+                HTTP_X_PROFILE=create_token(
+                    key=SECRET_KEY, data={"user_id": self.user.pk}, expire_minutes=5
+                ),
+            )
+
+        self.assertNotIn("X-Profile-Id", response)
+        self.assertFalse(RequestProfile.objects.exists())
+
+    def staff_token(self) -> str:
+        self.user.is_staff = True
+        self.user.save()
+        out = io.StringIO()
+        call_command("profiletoken", self.user.mobile, stdout=out)
+        return out.getvalue().split(": ", 1)[1].strip()
+
+    def get_profiled(self, token: str):
+        with override_settings(MEDIA_ROOT=self.media_root):
+            return self.client.get(
+                self.base_url,
+                HTTP_AUTHORIZATION=self.auth_token,
+                HTTP_X_PROFILE=token,
+            )
+
+    def test_profile_stored(self):
+        response = self.get_profiled(self.staff_token())
+
+        self.assertEqual(response.status_code, 200)
+        profile = RequestProfile.objects.get(pk=response["X-Profile-Id"])
+        self.assertEqual(profile.trigger, PROFILE_TRIGGER_HEADER)
+        self.assertEqual(profile.user, self.user)
+        self.assertEqual(profile.view, "authentication:main")
+        self.assertTrue(profile.file.name.startswith("admin/profiles/"))
+        self.assertIn("function calls", profile.summary)
+
+    def test_profile_token_rechecked(self):
+        token: str = self.staff_token()
+
+        # Demoted Staff
+        self.user.is_staff = False
+        self.user.save()
+        self.assertNotIn("X-Profile-Id", self.get_profiled(token))
+
+        # Token Without iat (Uncapped Age)
+        token = create_token(
+            key=SECRET_KEY,
+            data={"user_id": self.user.pk, "profile": True},
+            expire_minutes=5,
+        )
+        self.user.is_staff = True
+        self.user.save()
+        self.assertNotIn("X-Profile-Id", self.get_profiled(token))
+
+        with self.assertRaises(CommandError):
+            call_command("profiletoken", self.user.mobile, minutes=100000)
+
+    def test_profile_skipped_while_busy(self):
+        token: str = self.staff_token()
+
+        # Overlapping Requests Are Served Unprofiled
+        with profile_lock:
+            response = self.get_profiled(token)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("X-Profile-Id", response)
+        self.assertFalse(RequestProfile.objects.exists())
@@ -0,0 +1,105 @@
+import os
+import shutil
+import tempfile
+
+from asgiref.sync import sync_to_async
+from django.test import TestCase, override_settings
+from project_title.settings import MEDIA_URL
+
+from apps.authentication.models import User
+
+
+class MediaTests(TestCase):
+    content: bytes = b"0123456789"
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        os.makedirs(os.path.join(self.media_root, "admin"))
+        for name in ("file.txt", "admin/file.txt"):
+            with open(os.path.join(self.media_root, name), "wb") as f:
+                f.write(self.content)
+
+        settings_override = override_settings(
+            MEDIA_ROOT=self.media_root, MEDIA_ACCEL_REDIRECT=False
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def get(self, name: str, **headers):
+        return self.client.get("{}{}".format(MEDIA_URL, name), **headers)
+
+    def test_full_file(self):
+        response = self.get("file.txt")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), self.content)
+        self.assertEqual(response["Content-Length"], str(len(self.content)))
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertIn("ETag", response)
+        self.assertIn("Last-Modified", response)
+
+    def test_range(self):
+        response = self.get("file.txt", HTTP_RANGE="bytes=2-5")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b"".join(response.streaming_content), b"2345")
+        self.assertEqual(response["Content-Range"], "bytes 2-5/10")
+
+        response = self.get("file.txt", HTTP_RANGE="bytes=-3")
+        self.assertEqual(b"".join(response.streaming_content), b"789")
+
+        response = self.get("file.txt", HTTP_RANGE="bytes=20-")
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], "bytes */10")
+
+    def test_conditional(self):
+        response = self.get("file.txt")
+        etag, last_modified = response["ETag"], response["Last-Modified"]
+        self.assertTrue(response["Cache-Control"].startswith("public"))
+
+        response = self.get("file.txt", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+        response = self.get("file.txt", HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+        # Range Only Honoured While If-Range Still Matches
+        response = self.get("file.txt", HTTP_RANGE="bytes=0-1", HTTP_IF_RANGE=etag)
+        self.assertEqual(response.status_code, 206)
+        response = self.get("file.txt", HTTP_RANGE="bytes=0-1", HTTP_IF_RANGE='"old"')
+        self.assertEqual(response.status_code, 200)
+
+    def test_missing_and_private(self):
+        self.assertEqual(self.get("missing.txt").status_code, 404)
+        self.assertEqual(self.get("../manage.py").status_code, 404)
+        self.assertEqual(self.get("admin/file.txt").status_code, 404)
+        self.assertEqual(self.get("./admin/file.txt").status_code, 404)
+        self.assertEqual(self.get("a/../admin/file.txt").status_code, 404)
+        with override_settings(MEDIA_ACCEL_REDIRECT=True):
+            self.assertEqual(self.get("./admin/file.txt").status_code, 404)
+
+    def test_accel_redirect(self):
+        with override_settings(MEDIA_ACCEL_REDIRECT=True):
+            response = self.get("file.txt")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-Accel-Redirect"], "/protected-storage/file.txt")
+        self.assertNotIn("Content-Type", response)
+        self.assertEqual(response.content, b"")
+
+    async def test_async(self):
+        response = await self.async_client.get("{}file.txt".format(MEDIA_URL))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), self.content)
+
+        response = await self.async_client.get("{}./admin/file.txt".format(MEDIA_URL))
+        self.assertEqual(response.status_code, 404)
+
+        # Session Users Are Resolved Without Sync ORM Calls On The Event Loop
+        user = await sync_to_async(User.objects.create_superuser)(
+            mobile="09100000001", password="password"
+        )
+        await self.async_client.aforce_login(user)
+        for name in ("file.txt", "admin/file.txt"):
+            response = await self.async_client.get("{}{}".format(MEDIA_URL, name))
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(b"".join(response.streaming_content), self.content)
@@ -0,0 +1,89 @@
+import zstandard as zstd
+from cryptography.fernet import InvalidToken
+from django.test import SimpleTestCase
+from project_title.settings import SECRET_KEY
+
+from CONSTANTS import ZSTD_DICTIONARY_ACTIVE_KEY
+from services.redis import RedisClient
+from tools.security import PAYLOAD_CIPHERS, PayloadCipher, VersionedCipher
+
+
+class VersionedCipherTests(SimpleTestCase):
+    data: bytes = b"payload"
+
+    def test_reads_every_version(self):
+        blobs: dict = {
+            name: VersionedCipher(key=SECRET_KEY, name=name).encrypt(self.data)
+            for name in PAYLOAD_CIPHERS
+        }
+        for name, blob in blobs.items():
+            # Version Byte Selects The Reader
+            self.assertEqual(blob[:1], PAYLOAD_CIPHERS[name].VERSION)
+            for reader in PAYLOAD_CIPHERS:
+                with self.subTest(writer=name, reader=reader):
+                    cipher = VersionedCipher(key=SECRET_KEY, name=reader)
+                    self.assertEqual(cipher.decrypt(blob), self.data)
+
+    def test_rejects_unknown_or_tampered(self):
+        cipher: VersionedCipher = VersionedCipher(key=SECRET_KEY, name="aesgcm")
+        blob: bytes = cipher.encrypt(self.data)
+        for bad in (b"\x7f" + blob[1:], blob[:-1] + bytes([blob[-1] ^ 1])):
+            with self.assertRaises(InvalidToken):
+                cipher.decrypt(bad)
+        with self.assertRaises(ValueError):
+            VersionedCipher(key=SECRET_KEY, name="rot13")
+
+    def test_payload_cipher_is_abstract(self):
+        with self.assertRaises(TypeError):
+            PayloadCipher()
+
+
+class RedisDictionaryTests(SimpleTestCase):
+    key: str = "test-redis-dictionary-payload"
+    value: dict = {"user_id": 7, "mobile": "09100000007", "is_active": True}
+
+    def setUp(self):
+        self.client = RedisClient()
+        samples: list[bytes] = [
+            '{{"user_id": {}, "mobile": "0910{:07d}", "is_active": true}}'.format(
+                i, i
+            ).encode("utf-8")
+            for i in range(1000)
+        ]
+        self.dictionary = zstd.train_dictionary(1024, samples)
+        self.previous_active = self.client.client.get(ZSTD_DICTIONARY_ACTIVE_KEY)
+        self.dictionary_id: int = self.client.save_dictionary(self.dictionary)
+        self.addCleanup(self.restore)
+
+    def restore(self):
+        self.client.delete(self.key)
+        self.client.delete(self.client._dictionary_key(self.dictionary_id))
+        if self.previous_active is None:
+            self.client.delete(ZSTD_DICTIONARY_ACTIVE_KEY)
+        else:
+            self.client.client.set(ZSTD_DICTIONARY_ACTIVE_KEY, self.previous_active)
+
+    def test_dictionary_round_trip(self):
+        self.client.set_json(self.key, self.value, use_dictionary=True)
+        payload: bytes = self.client.cipher.decrypt(self.client.client.get(self.key))
+        self.assertEqual(self.client._frame_dictionary_id(payload), self.dictionary_id)
+
+        # A Fresh Process Picks Up The Active Dictionary On First Use
+        fresh: RedisClient = RedisClient()
+        self.assertEqual(fresh._active_dictionary()[0], self.dictionary_id)
+        self.assertEqual(fresh.get_json(self.key), self.value)
+
+    def test_missing_dictionary_is_a_miss(self):
+        self.client.set_json(self.key, self.value, use_dictionary=True)
+        self.client.delete(self.client._dictionary_key(self.dictionary_id))
+
+        fresh: RedisClient = RedisClient()
+        self.assertIsNone(fresh.get_json(self.key))
+        self.assertEqual(fresh.get_json_with_ttl(self.key), (None, None))
+
+    def test_dictionaries_outside_cache_namespace(self):
+        # Cache Flushes ("redisflush -p :1:") Must Not Drop Dictionaries
+        keys: list[bytes] = list(self.client.get_keys_by_prefix(":1:"))
+        self.assertNotIn(
+            self.client._dictionary_key(self.dictionary_id).encode("utf-8"), keys
+        )
@@ -0,0 +1,274 @@
+from itertools import product
+from unittest import skipUnless
+
+from django.apps.registry import Apps
+from django.contrib.postgres.indexes import OpClass
+from django.db import connection, models
+from django.db.models import Q
+from django.test import SimpleTestCase, TestCase
+
+from CONSTANTS import SEARCH_VARIANTS_LIMIT
+from apps.authentication.models import User
+from tools.converters import different_persian_character_modes, normalize_persian
+from utils.db import EncryptedField, normalized_text, search_by_query, trigram_index
+
+search_apps: Apps = Apps(["tests"])
+
+
+class Contact(models.Model):
+    name = EncryptedField()
+    trigram_name = EncryptedField(ngram_strategy="trigram")
+    blind_name = EncryptedField(index_version=2)
+    rolling_name = EncryptedField(index_version=2, previous_index_version=1)
+    normal_name = EncryptedField(normalize=True)
+
+    class Meta:
+        apps = search_apps
+        app_label = "tests"
+
+
+def sql_translate(text: str, sources: str, targets: str) -> str:
+    # PostgreSQL TRANSLATE(): Sources Past The End Of targets Are Removed
+    table: dict = str.maketrans(
+        sources[: len(targets)], targets, sources[len(targets) :]
+    )
+    return text.translate(table)
+
+
+def q_matches(q: Q, row: dict) -> bool:
+    # Evaluates search_by_query Output Against Stored Index Columns (No Database)
+    results: list[bool] = []
+    for child in q.children:
+        if isinstance(child, Q):
+            results.append(q_matches(child, row))
+            continue
+        lookup, value = child
+        column, operator = lookup.rsplit("__", 1)
+        if operator == "in":
+            results.append(row.get(column) in value)
+        elif operator == "overlap":
+            results.append(bool(set(row[column]) & set(value)))
+        elif operator == "contains":
+            results.append(set(value) <= set(row[column]))
+    matched: bool = any(results) if q.connector == Q.OR else all(results)
+    return matched != q.negated
+
+
+def q_lookups(q: Q) -> list[str]:
+    return [
+        lookup
+        for child in q.children
+        for lookup in (q_lookups(child) if isinstance(child, Q) else [child[0]])
+    ]
+
+
+class PersianVariantTests(SimpleTestCase):
+    def test_all_variants_under_limit(self):
+        self.assertCountEqual(
+            different_persian_character_modes("علی ۱"),
+            ["علی 1", "علی ۱", "علي 1", "علي ۱"],
+        )
+
+    def test_full_expansion_within_limit(self):
+        # 2^5 = SEARCH_VARIANTS_LIMIT: Every Variant, None Lost To Duplicates
+        options: dict = {"ی": "یي", "ک": "کك", "ي": "یي", "۱": "1۱", "۲": "2۲"}
+        for query in ("ی ی ک ک ۱", "علي رضايي ۱۲"):
+            with self.subTest(query=query):
+                expected: set = {
+                    "".join(chars)
+                    for chars in product(*(options.get(char, char) for char in query))
+                }
+                self.assertEqual(len(expected), SEARCH_VARIANTS_LIMIT)
+                variants: list[str] = different_persian_character_modes(query)
+                self.assertEqual(len(variants), len(expected))
+                self.assertEqual(set(variants), expected)
+
+    def test_uniform_variants_survive_limit(self):
+        query: str = "کوچه یکم پلاک ۱۲"
+        variants: list[str] = different_persian_character_modes(query)
+
+        self.assertLessEqual(len(variants), SEARCH_VARIANTS_LIMIT)
+        for variant in (
+            "کوچه یکم پلاک 12",
+            "كوچه يكم پلاك 12",
+            "كوچه يكم پلاك ۱۲",
+            "كوچة يكم پلاك ۱۲",
+        ):
+            self.assertIn(variant, variants)
+
+    def test_normalize(self):
+        self.assertEqual(
+            normalize_persian("كوچة يكم ۱۲"), normalize_persian("کوچه یکم 12")
+        )
+
+
+class EncryptedSearchTests(SimpleTestCase):
+    value: str = "علی رضایی تهران"
+
+    @staticmethod
+    def field(name: str) -> EncryptedField:
+        return Contact._meta.get_field(name)
+
+    def indexed(self, name: str, value: str, columns_of: str = "") -> dict:
+        # Index Columns As pre_save Would Store Them (Optionally Under Another Field)
+        field: EncryptedField = self.field(name)
+        target: EncryptedField = self.field(columns_of or name)
+        hashed_value, hashed_ngrams = field.build_index(value)
+        return {
+            target.hash_field_name: hashed_value,
+            target.ngram_field_name: hashed_ngrams,
+        }
+
+    def search(self, name: str, query: str) -> Q:
+        field: EncryptedField = self.field(name)
+        return search_by_query(
+            [field.hash_field_name, field.ngram_field_name], query, model=Contact
+        )
+
+    def assertFinds(self, name: str, row: dict, *queries: str):
+        for query in queries:
+            with self.subTest(field=name, query=query):
+                self.assertTrue(q_matches(self.search(name, query), row))
+
+    def assertMisses(self, name: str, row: dict, *queries: str):
+        for query in queries:
+            with self.subTest(field=name, query=query):
+                self.assertFalse(q_matches(self.search(name, query), row))
+
+    def test_strategies(self):
+        for name in ("name", "trigram_name"):
+            row: dict = self.indexed(name, self.value)
+            self.assertFinds(
+                name, row, self.value, "رضایی", "رضاي", "ضای", "هران", "رض"
+            )
+            self.assertMisses(name, row, "مشهد", "رضاییان")
+
+        # Trigram Queries Need Every Window, Not One Exact Gram
+        row = self.indexed("trigram_name", self.value)
+        self.assertFinds("trigram_name", row, "تهران", "علی تهران")
+
+    def test_index_versions(self):
+        self.assertEqual(len(self.indexed("name", self.value)["name_hash"]), 64)
+        self.assertEqual(
+            len(self.indexed("blind_name", self.value)["blind_name_hash"]), 32
+        )
+
+        # Version 2 Only Finds Rows Indexed With Version 2
+        self.assertFinds(
+            "blind_name", self.indexed("blind_name", self.value), self.value, "رضا"
+        )
+        self.assertMisses(
+            "blind_name",
+            self.indexed("name", self.value, columns_of="blind_name"),
+            self.value,
+            "رضا",
+        )
+
+        # During A Rollout Both Versions Match Until reindexencrypted Finishes
+        for source in ("name", "rolling_name"):
+            self.assertFinds(
+                "rolling_name",
+                self.indexed(source, self.value, columns_of="rolling_name"),
+                self.value,
+                "رضا",
+            )
+
+    def test_normalize(self):
+        row: dict = self.indexed("normal_name", "علي رضايي ۱۲")
+        self.assertFinds("normal_name", row, "علی رضایی 12", "علي", "رضای", "۱۲")
+
+        # One Normalized Hash Instead Of Every Character Variant
+        for lookup, value in self.search("normal_name", "علی رضایی").children:
+            if lookup.endswith("__in"):
+                self.assertEqual(len(value), 1)
+
+    def test_overlap_contains_split(self):
+        # Single-Gram Variants Collapse Into One && Predicate
+        lookups: list[str] = q_lookups(self.search("trigram_name", "رضا"))
+        self.assertIn("trigram_name_ngrams__overlap", lookups)
+        self.assertNotIn("trigram_name_ngrams__contains", lookups)
+
+        # Multi-Gram Variants Need Every Gram (@>)
+        lookups = q_lookups(self.search("trigram_name", "رضایی"))
+        self.assertIn("trigram_name_ngrams__contains", lookups)
+
+    def test_empty_query_matches_nothing(self):
+        row: dict = self.indexed("normal_name", self.value)
+        for query in ("ـ", "ءـ"):
+            with self.subTest(query=query):
+                self.assertEqual(self.search("normal_name", query), Q(pk__in=[]))
+                self.assertFalse(q_matches(self.search("normal_name", query), row))
+
+
+class TrigramSearchTests(SimpleTestCase):
+    trigram_fields: tuple[str, ...] = ("name", "mobile", "address")
+
+    def search(self, query: str, search_fields: tuple[str, ...] = ()) -> Q:
+        return search_by_query(
+            search_fields or ("pk", *self.trigram_fields),
+            query,
+            model=User,
+            trigram_fields=self.trigram_fields,
+        )
+
+    def test_sql_mirrors_normalize_persian(self):
+        sources, targets = (
+            expression.value
+            for expression in normalized_text("name").get_source_expressions()[1:]
+        )
+        for text in ("كوچة يكم ۱۲ Abc", "مؤسسهٔ ء علیٌ ٠١٢", "ـسلامـ"):
+            self.assertEqual(
+                sql_translate(text.upper(), sources, targets),
+                normalize_persian(text).upper(),
+            )
+
+    def test_trigram_index(self):
+        index = trigram_index("name", "user_name_trgm")
+        expression = index.expressions[0]
+        self.assertIsInstance(expression, OpClass)
+        self.assertEqual(expression.extra["name"], "gin_trgm_ops")
+        self.assertEqual(
+            expression.get_source_expressions()[0], normalized_text("name")
+        )
+        self.assertIn(index, User._meta.indexes)
+
+    def test_one_normalized_like_per_field(self):
+        children: list = self.search("علي ۱۲").children
+        self.assertEqual(len(children), len(self.trigram_fields))
+        self.assertCountEqual(
+            [lookup.lhs for lookup in children],
+            [normalized_text(field) for field in self.trigram_fields],
+        )
+        self.assertEqual({lookup.rhs for lookup in children}, {"علی 12"})
+
+    def test_key_lookups(self):
+        self.assertIn(("pk", 12), self.search("۱۲").children)
+        # Non-Decimal Digits (e.g. "²") Skip The Key Instead Of Failing
+        self.assertNotIn("pk", str(self.search("²")))
+
+        # Text Fields Ending In "id" Keep Their Regular Search
+        q: Q = search_by_query(("national_id", "paid"), "abc", trigram_fields=("name",))
+        self.assertIn(("national_id__icontains", "abc"), q.children)
+        self.assertIn(("paid__icontains", "abc"), q.children)
+
+
+@skipUnless(connection.vendor == "postgresql", "TRANSLATE And pg_trgm")
+class TrigramSearchDatabaseTests(TestCase):
+    def test_search(self):
+        user = User.objects.create_user(mobile="09101234567", name="علي رضايي")
+        User.objects.create_user(mobile="09107654321", name="مریم")
+
+        for query in ("علی", "رضایی", "علي رضايي", "۱۲۳۴", "09101234567"):
+            self.assertEqual(
+                list(
+                    User.objects.filter(
+                        search_by_query(
+                            ("pk", "name", "mobile", "address"),
+                            query,
+                            model=User,
+                            trigram_fields=("name", "mobile", "address"),
+                        )
+                    )
+                ),
+                [user],
+            )
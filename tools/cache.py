@@ -0,0 +1,71 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self.max_size: int = max_size
+        self.ttl: float = ttl
+        self._items: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            item: Optional[Tuple[float, Any]] = self._items.get(key)
+            if item is None:
+                return None
+
+            # Drop Expired Item
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._items[key]
+                return None
+
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._items[key] = (time.monotonic() + self.ttl, value)
+            self._items.move_to_end(key)
+
+            # Evict Least Recently Used
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def delete(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._items.pop(key, None) is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class Counters:
+    def __init__(
+        self, *names: str, on_incr: Optional[Callable[[str, int], None]] = None
+    ) -> None:
+        self._values: Dict[str, int] = {name: 0 for name in names}
+        self._lock: threading.Lock = threading.Lock()
+        self._on_incr: Optional[Callable[[str, int], None]] = on_incr
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._values[name] = self._values.get(name, 0) + amount
+        if self._on_incr:
+            self._on_incr(name, amount)
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._values)
+
+    def reset(self) -> None:
+        with self._lock:
+            for name in self._values:
+                self._values[name] = 0
@@ -1,9 +1,14 @@
-from typing import Union, List, Dict
+from itertools import chain
+from typing import Union, List, Dict, Iterator
 
 from bs4 import BeautifulSoup
 from markdown2 import Markdown
 
-from CONSTANTS import PERSIAN_ENGLISH_NUMS
+from CONSTANTS import (
+    PERSIAN_ENGLISH_NUMS,
+    PERSIAN_NORMALIZATION,
+    SEARCH_VARIANTS_LIMIT,
+)
 
 
 def _(msg: str):
@@ -446,7 +451,17 @@ def add_YE_to_persian_name(name: str) -> str:
     return name
 
 
-def different_persian_character_modes(text: str) -> List[str]:
+PERSIAN_NORMALIZATION_TABLE: Dict[int, str] = str.maketrans(PERSIAN_NORMALIZATION)
+
+
+def normalize_persian(text: str) -> str:
+    # One Canonical Form (Instead Of Every Character Variant)
+    return text.translate(PERSIAN_NORMALIZATION_TABLE)
+
+
+def different_persian_character_modes(
+    text: str, limit: int = SEARCH_VARIANTS_LIMIT
+) -> List[str]:
     TABLE: Dict[str, List[str]] = {
         "۰": ["0", "۰"],
         "۱": ["1", "۱"],
@@ -477,16 +492,34 @@ def different_persian_character_modes(text: str) -> List[str]:
     if not changeable_positions:
         return [text]
 
-    results: set = set()
-    num_combinations: int = 2 ** len(changeable_positions)
+    # 2^k Variants For k Changeable Characters, At Most limit Unique Ones. Whole
+    # Groups First (Every ی As ي, Every Digit Persian, ...) So Consistently Typed
+    # Forms Survive The Cap, Then Every Per-Position Mix (The Full Set If It Fits)
+    group_keys: List[str] = [
+        "digits" if options[0].isdigit() else options[0]
+        for pos, char, options in changeable_positions
+    ]
+    groups: List[str] = list(dict.fromkeys(group_keys))
+    group_indexes: List[int] = [groups.index(key) for key in group_keys]
+    full_mask: int = 2 ** len(groups) - 1
+    choices: Iterator[List[int]] = chain(
+        (
+            [(mask >> g) & 1 for g in group_indexes]
+            for mask in chain((0, full_mask), range(1, full_mask))
+        ),
+        (
+            [(mask >> j) & 1 for j in range(len(changeable_positions))]
+            for mask in range(2 ** len(changeable_positions))
+        ),
+    )
 
-    for i in range(num_combinations):
+    results: set = {text}
+    for choice in choices:
+        if len(results) >= limit:
+            break
         text_chars: List[str] = list(text)
-
-        for j, (pos, original, options) in enumerate(changeable_positions):
-            choice_index: int = 1 if (i & (1 << j)) else 0
-            text_chars[pos] = options[choice_index]
-
+        for (pos, char, options), index in zip(changeable_positions, choice):
+            text_chars[pos] = options[index]
         results.add("".join(text_chars))
 
     return list(results)
@@ -1,6 +1,6 @@
 import random
 import time
-from typing import List, Set
+from typing import List, Optional, Set
 
 
 def generate_unique_number() -> str:
@@ -9,7 +9,12 @@ def generate_unique_number() -> str:
     return "{}{}".format(time_stamp, random_num)
 
 
-def generate_ngrams(text: str, min_length: int = 2) -> List[str]:
+def generate_ngrams(
+    text: str,
+    min_length: int = 2,
+    max_length: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+) -> List[str]:
     text = text.lower().strip()
     ngrams: Set[str] = set()
 
@@ -17,17 +22,53 @@ def generate_ngrams(text: str, min_length: int = 2) -> List[str]:
     ngrams.add(text)
 
     # Add Words
-    words: List[str] = text.split()
+    words: List[str] = text.split()[:max_tokens]
     for word in words:
         if len(word) >= min_length:
             ngrams.add(word)
 
-    # Add Character N-Grams For Each Word
+    # Add Character N-Grams For Each Word (Up To max_length Characters)
     for word in words:
         for i in range(len(word)):
-            for j in range(i + min_length, len(word) + 1):
-                substring: str = word[i:j]
-                if len(substring) >= min_length:
-                    ngrams.add(substring)
+            stop: int = (
+                len(word) if max_length is None else min(len(word), i + max_length)
+            )
+            for j in range(i + min_length, stop + 1):
+                ngrams.add(word[i:j])
 
     return list(ngrams)
+
+
+def generate_trigrams(
+    text: str, size: int = 3, min_size: int = 2, max_tokens: Optional[int] = None
+) -> List[str]:
+    grams: Set[str] = set()
+
+    # Fixed-Length Windows Per Word, Plus Shorter Ones Down To min_size So Short
+    # Queries Still Match Inside Longer Words (Shorter Words Are Kept Whole)
+    for word in text.lower().split()[:max_tokens]:
+        if len(word) <= min_size:
+            grams.add(word)
+            continue
+        for length in range(min_size, min(size, len(word)) + 1):
+            for i in range(len(word) - length + 1):
+                grams.add(word[i : i + length])
+
+    return list(grams)
+
+
+def decompose_query(text: str, max_length: Optional[int] = None) -> List[str]:
+    # Grams A Value Must All Contain To Match text (Longer Words Split Into Windows)
+    text = text.lower().strip()
+    if max_length is None:
+        return [text]
+
+    grams: Set[str] = set()
+    for word in text.split():
+        if len(word) <= max_length:
+            grams.add(word)
+            continue
+        for i in range(len(word) - max_length + 1):
+            grams.add(word[i : i + max_length])
+
+    return list(grams)
@@ -1,6 +1,15 @@
-from typing import Dict, Optional
+import base64
+import hashlib
+import os
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Type, Union
 
 import jwt
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from jwt import ExpiredSignatureError, InvalidTokenError
 
 from tools.datetimes import dt
@@ -21,3 +30,114 @@ def decode_token(key: str, token: str) -> Optional[Dict]:
         return decoded
     except (ExpiredSignatureError, InvalidTokenError):
         return None
+
+
+class PayloadCipher(ABC):
+    VERSION: bytes = b""
+
+    @abstractmethod
+    def encrypt(self, data: bytes) -> bytes: ...
+
+    @abstractmethod
+    def decrypt(self, blob: bytes) -> bytes: ...
+
+
+class FernetCipher(PayloadCipher):
+    # Fernet Tokens Are URL-Safe Base64 Starting With 0x80 -> "g"
+    VERSION: bytes = b"g"
+
+    def __init__(self, key: str) -> None:
+        self.fernet: Fernet = Fernet(key)
+
+    def encrypt(self, data: bytes) -> bytes:
+        return self.fernet.encrypt(data)
+
+    def decrypt(self, blob: bytes) -> bytes:
+        return self.fernet.decrypt(blob)
+
+
+class AEADCipher(PayloadCipher):
+    ALGORITHM: Type[Union[AESGCM, ChaCha20Poly1305]]
+    NONCE_SIZE: int = 12
+
+    def __init__(self, key: str) -> None:
+        derived_key: bytes = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=b"payload-cipher-" + self.VERSION,
+        ).derive(base64.urlsafe_b64decode(key))
+        self.aead: Union[AESGCM, ChaCha20Poly1305] = self.ALGORITHM(derived_key)
+
+    def encrypt(self, data: bytes) -> bytes:
+        nonce: bytes = os.urandom(self.NONCE_SIZE)
+        return self.VERSION + nonce + self.aead.encrypt(nonce, data, self.VERSION)
+
+    def decrypt(self, blob: bytes) -> bytes:
+        nonce: bytes = blob[1 : 1 + self.NONCE_SIZE]
+        try:
+            return self.aead.decrypt(nonce, blob[1 + self.NONCE_SIZE :], self.VERSION)
+        except InvalidTag:
+            raise InvalidToken
+
+
+class AESGCMCipher(AEADCipher):
+    VERSION: bytes = b"\x01"
+    ALGORITHM = AESGCM
+
+
+class ChaCha20Cipher(AEADCipher):
+    VERSION: bytes = b"\x02"
+    ALGORITHM = ChaCha20Poly1305
+
+
+PAYLOAD_CIPHERS: Dict[str, Type[PayloadCipher]] = {
+    "fernet": FernetCipher,
+    "aesgcm": AESGCMCipher,
+    "chacha20": ChaCha20Cipher,
+}
+
+
+class VersionedCipher(PayloadCipher):
+    def __init__(self, key: str, name: str) -> None:
+        if name not in PAYLOAD_CIPHERS:
+            raise ValueError("Unknown payload cipher: {}".format(name))
+
+        # Write With One Cipher, Read With All Of Them
+        self.readers: Dict[bytes, PayloadCipher] = {
+            cipher_class.VERSION: cipher_class(key)
+            for cipher_class in PAYLOAD_CIPHERS.values()
+        }
+        self.writer: PayloadCipher = self.readers[PAYLOAD_CIPHERS[name].VERSION]
+
+    def encrypt(self, data: bytes) -> bytes:
+        return self.writer.encrypt(data)
+
+    def decrypt(self, blob: bytes) -> bytes:
+        reader: Optional[PayloadCipher] = self.readers.get(blob[:1])
+        if reader is None:
+            raise InvalidToken
+        return reader.decrypt(blob)
+
+
+class BlindIndex:
+    def __init__(self, key: str, digest_size: int) -> None:
+        derived_key: bytes = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=b"blind-index",
+        ).derive(base64.urlsafe_b64decode(key))
+
+        # Keyed State Built Once; Each Value Hashes A Copy Of It
+        self.state = hashlib.blake2b(key=derived_key, digest_size=digest_size)
+
+    def digest(self, value: str) -> bytes:
+        state = self.state.copy()
+        state.update(value.encode("utf-8"))
+        return state.digest()
+
+    def hexdigest(self, value: str) -> str:
+        state = self.state.copy()
+        state.update(value.encode("utf-8"))
+        return state.hexdigest()
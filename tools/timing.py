@@ -0,0 +1,69 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Dict, Generator, Optional
+
+
+class RequestTimer:
+    def __init__(self) -> None:
+        self.started_at: float = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.running: Dict[str, float] = {}
+
+    def start(self, name: str) -> None:
+        self.running[name] = time.perf_counter()
+
+    def stop(self, name: str) -> None:
+        started: Optional[float] = self.running.pop(name, None)
+        if started is not None:
+            self.add(name, (time.perf_counter() - started) * 1000)
+
+    def add(self, name: str, duration_ms: float) -> None:
+        # Repeated Phases Accumulate (e.g. Several Redis Reads)
+        self.phases[name] = self.phases.get(name, 0.0) + duration_ms
+
+    @property
+    def total_ms(self) -> float:
+        return (time.perf_counter() - self.started_at) * 1000
+
+    def summary(self) -> Dict[str, float]:
+        return {name: round(duration, 2) for name, duration in self.phases.items()}
+
+    def server_timing(self) -> str:
+        # Phases May Nest (e.g. auth Includes auth-redis), Like Server-Timing Allows
+        metrics = [
+            "{};dur={:.2f}".format(name, duration)
+            for name, duration in self.phases.items()
+        ]
+        metrics.append("total;dur={:.2f}".format(self.total_ms))
+        return ", ".join(metrics)
+
+
+current_timer: ContextVar[Optional[RequestTimer]] = ContextVar(
+    "current_timer", default=None
+)
+
+
+def start_timer() -> Token:
+    return current_timer.set(RequestTimer())
+
+
+def stop_timer(token: Token) -> Optional[RequestTimer]:
+    timer: Optional[RequestTimer] = current_timer.get()
+    current_timer.reset(token)
+    return timer
+
+
+@contextmanager
+def phase(name: str) -> Generator[None, None, None]:
+    # No-Op Outside A Timed Request (Commands, Celery Tasks)
+    timer: Optional[RequestTimer] = current_timer.get()
+    if timer is None:
+        yield
+        return
+
+    started: float = time.perf_counter()
+    try:
+        yield
+    finally:
+        timer.add(name, (time.perf_counter() - started) * 1000)
@@ -42,6 +42,7 @@ class AbstractAdmin(admin.ModelAdmin):
     }
     list_filter_classes = []
     display_fields: list[str] = []
+    trigram_search_fields: tuple[str, ...] = ()  # Need A utils.db.trigram_index
     select_related_fields: list[str] = []
     prefetch_related_fields: list[str] = []
     raw_actions = []
@@ -67,7 +68,12 @@ class AbstractAdmin(admin.ModelAdmin):
 
     def get_search_results(self, request, queryset, search_term):
         if search_term:
-            q = search_by_query(search_fields=self.search_fields, query=search_term)
+            q = search_by_query(
+                search_fields=self.search_fields,
+                query=search_term,
+                model=self.model,
+                trigram_fields=self.trigram_search_fields,
+            )
             queryset = self._queryset_handler(queryset.filter(q))
 
         return queryset.distinct(), False
@@ -1,19 +1,31 @@
 import base64
 import json
 from hashlib import sha256
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Callable, Tuple
 
 from cryptography.fernet import Fernet
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.core.exceptions import FieldDoesNotExist
 from django.db import models, transaction, IntegrityError
-from django.db.models import Q, F
+from django.db.models import Q, F, Func, Value
+from django.db.models.functions import Upper
+from django.db.models.lookups import Contains
 from project_title.settings import SECRET_KEY
 from rest_framework import serializers
 
 from CONSTANTS import (
+    BLIND_INDEX_DIGEST_SIZE,
     GET_QUERY_FILTER_SEARCH_PREFIX,
+    PERSIAN_NORMALIZATION,
 )
-from tools.converters import different_persian_character_modes, md_to_html
-from tools.generators import generate_ngrams
+from tools.converters import (
+    different_persian_character_modes,
+    md_to_html,
+    normalize_persian,
+)
+from tools.generators import decompose_query, generate_ngrams, generate_trigrams
+from tools.security import BlindIndex
 
 cipher_suite: Fernet = Fernet(SECRET_KEY)
 db_transaction = transaction
@@ -29,6 +41,7 @@ __all__ = [
     "IntegrityError",
     "Q",
     "F",
+    "trigram_index",
 ]
 
 
@@ -37,28 +50,145 @@ def hash_to_db(val: str) -> str:
     return sha256(val.encode("utf-8")).hexdigest()
 
 
-def search_by_query(search_fields: List[str], query: Optional[str] = None) -> Q:
+# Blind Index Hashers By EncryptedField.index_version
+BLIND_INDEXES: Dict[int, Callable[[str], str]] = {
+    1: hash_to_db,
+    2: BlindIndex(SECRET_KEY, BLIND_INDEX_DIGEST_SIZE).hexdigest,
+}
+
+
+def get_encrypted_source(model, index_field: str) -> Optional["EncryptedField"]:
+    # Follow "relation__field_hash" / "relation__field_ngrams" To Its EncryptedField
+    *relations, name = index_field.split("__")
+    try:
+        for relation in relations:
+            model = model._meta.get_field(relation).related_model
+        fields = model._meta.get_fields()
+    except (AttributeError, FieldDoesNotExist):
+        return None
+
+    for field in fields:
+        if isinstance(field, EncryptedField) and name in (
+            field.hash_field_name,
+            field.ngram_field_name,
+        ):
+            return field
+    return None
+
+
+def normalized_text(field: str) -> Func:
+    # SQL Mirror Of normalize_persian(value).upper() (Single-Char Maps, Then Removals)
+    pairs: List[tuple] = sorted(
+        PERSIAN_NORMALIZATION.items(), key=lambda pair: pair[1] == ""
+    )
+    return Func(
+        Upper(field),
+        Value("".join(source for source, _target in pairs)),
+        Value("".join(target for _source, target in pairs)),
+        function="TRANSLATE",
+        output_field=models.TextField(),
+    )
+
+
+def trigram_index(field: str, name: str) -> GinIndex:
+    # pg_trgm GIN Index Serving search_by_query(..., trigram_fields=[field])
+    return GinIndex(OpClass(normalized_text(field), name="gin_trgm_ops"), name=name)
+
+
+def is_key_lookup(field: str, model=None) -> bool:
+    # pk/id (Also Across Relations) Or A Foreign Key Column; Not "national_id"
+    if field in ("pk", "id") or field.endswith(("__pk", "__id")):
+        return True
+    return model is not None and any(
+        f.is_relation and f.attname == field for f in model._meta.concrete_fields
+    )
+
+
+def search_by_query(
+    search_fields: List[str],
+    query: Optional[str] = None,
+    model=None,
+    trigram_fields: tuple[str, ...] = (),
+) -> Q:
     q_objects: Q = Q()
     if query:
         q: str = query.strip()
         q_modes: List[str] = different_persian_character_modes(q)
-        q_modes_hash: List[str] = [hash_to_db(i) for i in q_modes]
 
         for field in search_fields:
-            # Encrypted N-Grams (Partial Match)
-            if field.endswith("_ngrams"):
-                for q_mode_hash in q_modes_hash:
-                    q_objects |= Q(**{"{}__contains".format(field): [q_mode_hash]})
-
-            # Encrypted Hash (Exact Match)
-            elif field.endswith("_hash"):
-                for q_mode_hash in q_modes_hash:
-                    q_objects |= Q(**{field: q_mode_hash})
-
-            # Regular Field (Case-Insensitive Contains)
-            else:
+            # Trigram Field (One Normalized LIKE, Served By trigram_index)
+            if field in trigram_fields:
+                if normalize_persian(q):
+                    q_objects |= Q(
+                        Contains(normalized_text(field), normalize_persian(q).upper())
+                    )
+                continue
+
+            # Indexed Search Mode Matches Keys Exactly (An OR Branch Without An
+            # Index Would Turn The Whole Search Back Into A Sequential Scan)
+            if trigram_fields and is_key_lookup(field, model):
+                if normalize_persian(q).isdecimal():
+                    q_objects |= Q(**{field: int(normalize_persian(q))})
+                continue
+
+            if not field.endswith(("_ngrams", "_hash")):
+                # Regular Field (Case-Insensitive Contains)
                 for q_mode in q_modes:
                     q_objects |= Q(**{"{}__icontains".format(field): q_mode})
+                continue
+
+            source: Optional[EncryptedField] = (
+                get_encrypted_source(model, field) if model else None
+            )
+            hashers: List[Callable[[str], str]] = (
+                source.search_hashers() if source else [hash_to_db]
+            )
+            # Modes Normalizing To Nothing Would Turn Into Match-All Predicates
+            field_modes: List[str] = [
+                mode for mode in (source.search_modes(q) if source else q_modes) if mode
+            ]
+
+            # Encrypted Hash (Exact Match, One IN Predicate)
+            if field.endswith("_hash"):
+                if not field_modes:
+                    continue
+                q_objects |= Q(
+                    **{
+                        "{}__in".format(field): sorted(
+                            {
+                                hasher(q_mode)
+                                for hasher in hashers
+                                for q_mode in field_modes
+                            }
+                        )
+                    }
+                )
+                continue
+
+            # Encrypted N-Grams (Partial Match, All Query Grams Indexed)
+            hash_sets: List[List[str]] = [
+                [hasher(gram) for gram in grams]
+                for grams in (
+                    source.query_ngrams(q_mode) if source else [q_mode]
+                    for q_mode in field_modes
+                )
+                for hasher in hashers
+            ]
+            hash_sets = [hashes for hashes in hash_sets if hashes]
+            if source and source.ngram_is_array:
+                # Single-Gram Variants Collapse Into One GIN-Friendly && Predicate
+                singles: List[str] = sorted(
+                    {hashes[0] for hashes in hash_sets if len(hashes) == 1}
+                )
+                if singles:
+                    q_objects |= Q(**{"{}__overlap".format(field): singles})
+                hash_sets = [hashes for hashes in hash_sets if len(hashes) > 1]
+            for hashes in hash_sets:
+                q_objects |= Q(**{"{}__contains".format(field): hashes})
+
+        # Nothing Searchable Left (e.g. Only Keys And A Non-Numeric Query): No Rows
+        if not q_objects:
+            return Q(pk__in=[])
 
     return q_objects
 
@@ -117,17 +247,124 @@ def filter_objects(
 
 
 class EncryptedField(models.TextField):
+    NGRAM_STRATEGIES: tuple[str, ...] = ("all", "trigram")
+
     def __init__(self, *args, **kwargs) -> None:
         self.hash_field_name: Optional[str] = kwargs.pop("hash_field", None)
         self.ngram_field_name: Optional[str] = kwargs.pop("ngram_field", None)
 
-        if self.hash_field_name is None:
+        # Without Both Names, contribute_to_class Adds <name>_hash And A GIN-Indexed
+        # <name>_ngrams ArrayField Itself
+        self.auto_index_fields: bool = (
+            self.hash_field_name is None and self.ngram_field_name is None
+        )
+
+        # Blind Index Shape ("all": Every Substring, "trigram": Fixed 3-Grams)
+        self.ngram_strategy: str = kwargs.pop("ngram_strategy", "all")
+        self.ngram_max_length: Optional[int] = kwargs.pop("ngram_max_length", None)
+        self.ngram_max_tokens: Optional[int] = kwargs.pop("ngram_max_tokens", None)
+
+        # Index normalize_persian(value) (One Hash Per Token, No Variant Expansion)
+        self.normalize: bool = kwargs.pop("normalize", False)
+
+        # Blind Index Hasher; While previous_index_version Is Set (Even To The Same
+        # Version), Search Also Matches Rows reindexencrypted Has Not Rewritten Yet
+        self.index_version: int = kwargs.pop("index_version", 1)
+        self.previous_index_version: Optional[int] = kwargs.pop(
+            "previous_index_version", None
+        )
+
+        if not self.auto_index_fields and self.hash_field_name is None:
             raise ValueError("Set a hash_field")
-        if self.ngram_field_name is None:
+        if not self.auto_index_fields and self.ngram_field_name is None:
             raise ValueError("Set a ngram_field")
+        if self.ngram_strategy not in self.NGRAM_STRATEGIES:
+            raise ValueError(
+                "ngram_strategy must be one of {}".format(self.NGRAM_STRATEGIES)
+            )
+        for version in (self.index_version, self.previous_index_version):
+            if version is not None and version not in BLIND_INDEXES:
+                raise ValueError(
+                    "index_version must be one of {}".format(list(BLIND_INDEXES))
+                )
 
         super().__init__(*args, **kwargs)
 
+    def contribute_to_class(self, cls, name: str, *args, **kwargs) -> None:
+        super().contribute_to_class(cls, name, *args, **kwargs)
+        if not self.auto_index_fields:
+            return
+
+        self.hash_field_name = "{}_hash".format(name)
+        self.ngram_field_name = "{}_ngrams".format(name)
+
+        # Abstract Parents Leave It To Each Child; Migration State Models ("__fake__")
+        # Already List The Companion Fields And Index Explicitly
+        if cls._meta.abstract or cls.__module__ == "__fake__":
+            return
+
+        hash_field: models.CharField = models.CharField(
+            max_length=64, null=True, blank=True, editable=False, db_index=True
+        )
+        ngram_field: ArrayField = ArrayField(
+            models.CharField(max_length=64), default=list, blank=True, editable=False
+        )
+        # Declared Just Before This Field (Keeps Migration Field Order Stable)
+        hash_field.creation_counter = self.creation_counter - 0.2
+        ngram_field.creation_counter = self.creation_counter - 0.1
+        cls.add_to_class(self.hash_field_name, hash_field)
+        cls.add_to_class(self.ngram_field_name, ngram_field)
+
+        # original_attrs Is What The Migration Autodetector Reads
+        cls._meta.indexes = [
+            *cls._meta.indexes,
+            GinIndex(fields=[self.ngram_field_name]),
+        ]
+        cls._meta.original_attrs["indexes"] = cls._meta.indexes
+
+    @property
+    def ngram_is_array(self) -> bool:
+        try:
+            return isinstance(
+                self.model._meta.get_field(self.ngram_field_name), ArrayField
+            )
+        except (AttributeError, FieldDoesNotExist):
+            return False
+
+    def index_ngrams(self, value: str) -> List[str]:
+        if self.ngram_strategy == "trigram":
+            return generate_trigrams(value, max_tokens=self.ngram_max_tokens)
+        return generate_ngrams(
+            value, max_length=self.ngram_max_length, max_tokens=self.ngram_max_tokens
+        )
+
+    def query_ngrams(self, query: str) -> List[str]:
+        if self.ngram_strategy == "trigram":
+            return decompose_query(query, max_length=3)
+        return decompose_query(query, max_length=self.ngram_max_length)
+
+    def search_modes(self, query: str) -> List[str]:
+        if not self.normalize:
+            return different_persian_character_modes(query)
+
+        # Raw Query Too During Rollout (Rows Indexed Before normalize Was Enabled)
+        modes: List[str] = [normalize_persian(query)]
+        if self.previous_index_version is not None and query not in modes:
+            modes.append(query)
+        return modes
+
+    def search_hashers(self) -> List[Callable[[str], str]]:
+        versions: List[int] = [self.index_version]
+        if self.previous_index_version not in (None, self.index_version):
+            versions.append(self.previous_index_version)
+        return [BLIND_INDEXES[version] for version in versions]
+
+    def build_index(self, value: str) -> Tuple[str, List[str]]:
+        hasher: Callable[[str], str] = BLIND_INDEXES[self.index_version]
+        if self.normalize:
+            value = normalize_persian(value)
+        return hasher(value), [hasher(ngram) for ngram in self.index_ngrams(value)]
+
     def get_prep_value(self, value: Optional[str]) -> Optional[str]:
         if value is None:
             return value
@@ -146,23 +383,30 @@ class EncryptedField(models.TextField):
     def pre_save(self, model_instance, add):
         value: Optional[str] = getattr(model_instance, self.attname)
         if value is not None:
-            # Generate Hash For Exact Matching
-            hashed_value: str = hash_to_db(value)
-            if self.hash_field_name:
-                setattr(model_instance, self.hash_field_name, hashed_value)
-
-            # Generate N-Grams For Partial Search
-            if self.ngram_field_name:
-                ngrams: List[str] = generate_ngrams(value)
-                hashed_ngrams: List[str] = [hash_to_db(ngram) for ngram in ngrams]
-                setattr(model_instance, self.ngram_field_name, hashed_ngrams)
+            # Generate Hash For Exact Matching And N-Grams For Partial Search
+            hashed_value, hashed_ngrams = self.build_index(value)
+            setattr(model_instance, self.hash_field_name, hashed_value)
+            setattr(model_instance, self.ngram_field_name, hashed_ngrams)
 
         return super().pre_save(model_instance, add)
 
     def deconstruct(self) -> tuple:
         name, path, args, kwargs = super().deconstruct()
-        kwargs["hash_field"] = self.hash_field_name
-        kwargs["ngram_field"] = self.ngram_field_name
+        if not self.auto_index_fields:
+            kwargs["hash_field"] = self.hash_field_name
+            kwargs["ngram_field"] = self.ngram_field_name
+        if self.ngram_strategy != "all":
+            kwargs["ngram_strategy"] = self.ngram_strategy
+        if self.ngram_max_length is not None:
+            kwargs["ngram_max_length"] = self.ngram_max_length
+        if self.ngram_max_tokens is not None:
+            kwargs["ngram_max_tokens"] = self.ngram_max_tokens
+        if self.normalize:
+            kwargs["normalize"] = self.normalize
+        if self.index_version != 1:
+            kwargs["index_version"] = self.index_version
+        if self.previous_index_version is not None:
+            kwargs["previous_index_version"] = self.previous_index_version
         return name, path, args, kwargs
 
 
@@ -0,0 +1,157 @@
+import mimetypes
+import os
+from typing import BinaryIO, Optional, Tuple
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpRequest, HttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from CONSTANTS import MEDIA_PRIVATE_CACHE_CONTROL, MEDIA_PUBLIC_CACHE_CONTROL
+
+
+class FileRange:
+    # FileResponse Reads Until EOF; Stop At The End Of The Requested Range
+    def __init__(self, file: BinaryIO, start: int, length: int) -> None:
+        file.seek(start)
+        self.file: BinaryIO = file
+        self.remaining: int = length
+
+    def read(self, size: int = -1) -> bytes:
+        if self.remaining <= 0:
+            return b""
+        size = self.remaining if size < 0 else min(size, self.remaining)
+        data: bytes = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def media_path(relative: str) -> str:
+    # Reject Paths Escaping MEDIA_ROOT (e.g. "../")
+    try:
+        return safe_join(settings.MEDIA_ROOT, relative)
+    except SuspiciousFileOperation:
+        raise Http404
+
+
+def is_private_media(path: str) -> bool:
+    # Decide On The Resolved Path ("./admin/", "a/../admin/" Both Land Here)
+    relative: str = os.path.relpath(path, settings.MEDIA_ROOT)
+    return relative.split(os.sep)[0] == "admin"
+
+
+def file_etag(stat: os.stat_result) -> str:
+    return '"{:x}-{:x}"'.format(stat.st_mtime_ns, stat.st_size)
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    # Single Byte Range Only (Anything Else Gets The Full File)
+    units, _sep, spec = header.partition("=")
+    if units.strip() != "bytes" or "," in spec:
+        return None
+
+    first, _sep, last = spec.strip().partition("-")
+    try:
+        if first:
+            start: int = int(first)
+            end: int = int(last) if last else size - 1
+        else:
+            # Suffix Range (Last N Bytes)
+            start = max(size - int(last), 0) if int(last) else size
+            end = size - 1
+    except ValueError:
+        return None
+
+    if start < 0 or (last and end < start):
+        return None
+    # Start Past The End Is Unsatisfiable (416), Not Invalid
+    return start, min(end, size - 1)
+
+
+def accel_response(path: str) -> HttpResponse:
+    # Nginx Streams The File From Its Internal Location (sendfile, Range, 404)
+    relative: str = os.path.relpath(path, settings.MEDIA_ROOT).replace(os.sep, "/")
+    response: HttpResponse = HttpResponse()
+    response["X-Accel-Redirect"] = quote(
+        "{}{}".format(settings.MEDIA_ACCEL_PREFIX, relative)
+    )
+
+    # Let Nginx Pick The Type From mime.types
+    del response["Content-Type"]
+    return response
+
+
+def file_response(request: HttpRequest, path: str) -> HttpResponse:
+    try:
+        file: BinaryIO = open(path, "rb")
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        raise Http404
+
+    # One fstat For Size, ETag And Last-Modified
+    stat: os.stat_result = os.fstat(file.fileno())
+    etag: str = file_etag(stat)
+    last_modified: str = http_date(stat.st_mtime)
+
+    # If-None-Match / If-Modified-Since (304) And If-Match (412)
+    conditional: Optional[HttpResponse] = get_conditional_response(
+        request, etag=etag, last_modified=int(stat.st_mtime)
+    )
+    if conditional is not None:
+        file.close()
+        conditional["ETag"] = etag
+        conditional["Last-Modified"] = last_modified
+        return conditional
+
+    content_type: str = mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+    # A Stale If-Range Validator Means The Client Needs The Whole New File
+    range_header: Optional[str] = request.META.get("HTTP_RANGE")
+    if_range: Optional[str] = request.META.get("HTTP_IF_RANGE")
+    if if_range and if_range not in (etag, last_modified):
+        range_header = None
+    byte_range: Optional[Tuple[int, int]] = (
+        parse_range(range_header, stat.st_size) if range_header else None
+    )
+
+    if byte_range is None:
+        # Full File (Sent With sendfile By wsgi.file_wrapper When Available)
+        response: HttpResponse = FileResponse(file, content_type=content_type)
+    elif byte_range[0] >= stat.st_size:
+        file.close()
+        response = HttpResponse(status=416)
+        response["Content-Range"] = "bytes */{}".format(stat.st_size)
+        return response
+    else:
+        start, end = byte_range
+        response = FileResponse(
+            FileRange(file, start, end - start + 1),
+            status=206,
+            content_type=content_type,
+        )
+        response["Content-Length"] = str(end - start + 1)
+        response["Content-Range"] = "bytes {}-{}/{}".format(start, end, stat.st_size)
+
+    response["Accept-Ranges"] = "bytes"
+    response["ETag"] = etag
+    response["Last-Modified"] = last_modified
+    return response
+
+
+def serve_media(request: HttpRequest, path: str, private: bool) -> HttpResponse:
+    # path Comes From media_path()
+    if settings.MEDIA_ACCEL_REDIRECT:
+        response: HttpResponse = accel_response(path)
+    else:
+        response = file_response(request, path)
+
+    # Kept By Nginx On X-Accel-Redirect; Private Media Is Revalidated Every Time
+    response["Cache-Control"] = (
+        MEDIA_PRIVATE_CACHE_CONTROL if private else MEDIA_PUBLIC_CACHE_CONTROL
+    )
+    return response
@@ -1,18 +1,284 @@
+import cProfile
+import io
 import json
-import os
+import marshal
+import pstats
+import random
+import threading
 import time
+import uuid
 
-from django.db import connection
-from django.http import Http404, HttpResponseForbidden, FileResponse
-from django.utils.deprecation import MiddlewareMixin
+from asgiref.local import Local
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from author import middlewares as author_middlewares
+from django.core.files.base import ContentFile
+from django.db.models import Q
+from django.http import Http404, HttpResponseForbidden
+from django.utils.functional import SimpleLazyObject, empty
 from project_title import settings
 from project_title.log import logger_set
-from project_title.settings import MEDIA_URL
+from project_title.settings import MEDIA_URL, SECRET_KEY
+
+from CONSTANTS import (
+    LOG_BODY_MAX_BYTES,
+    LOG_BODY_SKIPPED_CONTENT_TYPES,
+    LOG_PATH_SAMPLE_RATES,
+    LOG_STATUS_SAMPLE_RATES,
+    LOG_SUCCESS_SAMPLE_RATE,
+    PROFILE_HEADER,
+    PROFILE_SAMPLE_RATE,
+    PROFILE_STATS_LIMIT,
+    PROFILE_TOKEN_MAX_AGE,
+    PROFILE_TRIGGER_HEADER,
+    PROFILE_TRIGGER_SAMPLED,
+    QUERY_BUDGET_DEFAULT,
+)
+from services.metrics import observe_redis_pool, observe_request
+from services.redis import get_pool_stats
+from tools.security import decode_token
+from tools.timing import start_timer, stop_timer
+from utils.media import is_private_media, media_path, serve_media
+from utils.queries import (
+    current_query_stats,
+    install_on_open_connections,
+    start_query_stats,
+    stop_query_stats,
+)
 
 logger = logger_set("utils.middlewares")
 
+# django-author Keeps The Request In A threading.local, Which Is Lost Across
+# sync_to_async Hops Under ASGI; asgiref's Local Follows The Request
+author_middlewares._thread_locals = Local()
+
+
+class BaseMiddleware:
+    # Runs Natively In Both WSGI (Sync) And ASGI (Async) Handler Chains
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+
+        response = self.process_request(request)
+        if response is None:
+            response = self.get_response(request)
+        return self.process_response(request, response)
+
+    async def __acall__(self, request):
+        response = await self.aprocess_request(request)
+        if response is None:
+            response = await self.get_response(request)
+        return await self.aprocess_response(request, response)
+
+    def process_request(self, request):
+        return None
+
+    async def aprocess_request(self, request):
+        return self.process_request(request)
+
+    def process_response(self, request, response):
+        return response
+
+    async def aprocess_response(self, request, response):
+        return self.process_response(request, response)
+
+
+class AuthorMiddleware(BaseMiddleware):
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+
+        author_middlewares._thread_locals.request = request
+        try:
+            return self.get_response(request)
+        finally:
+            author_middlewares._thread_locals.request = None
+
+    async def __acall__(self, request):
+        author_middlewares._thread_locals.request = request
+        try:
+            return await self.get_response(request)
+        finally:
+            author_middlewares._thread_locals.request = None
+
 
-class IPIdentificationMiddleware(MiddlewareMixin):
+class MetricsMiddleware(BaseMiddleware):
+    def process_request(self, request):
+        request._metrics_started = time.perf_counter()
+
+    def process_response(self, request, response):
+        # Label By Resolved View (Raw Paths Would Explode Cardinality)
+        resolver_match = getattr(request, "resolver_match", None)
+        observe_request(
+            request.method,
+            resolver_match.view_name if resolver_match else "unmatched",
+            response.status_code,
+            time.perf_counter() - request._metrics_started,
+        )
+        observe_redis_pool(get_pool_stats())
+        return response
+
+
+profile_lock = threading.Lock()
+
+
+class ProfilingMiddleware(BaseMiddleware):
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+
+        # Disabled Path: One Float Compare And One Dict Lookup
+        trigger = self.get_trigger(request)
+        if trigger is None:
+            return self.get_response(request)
+
+        if trigger == PROFILE_TRIGGER_HEADER and not self.is_staff_user(
+            request._profile_user_id
+        ):
+            return self.get_response(request)
+
+        profiler = self.start()
+        if profiler is None:
+            return self.get_response(request)
+
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            self.stop(profiler)
+        duration = time.perf_counter() - started
+
+        return self.store(request, response, profiler, trigger, duration)
+
+    async def __acall__(self, request):
+        trigger = self.get_trigger(request)
+        if trigger is None:
+            return await self.get_response(request)
+
+        if trigger == PROFILE_TRIGGER_HEADER and not await sync_to_async(
+            self.is_staff_user
+        )(request._profile_user_id):
+            return await self.get_response(request)
+
+        # Other Tasks Running Meanwhile Are Included
+        profiler = self.start()
+        if profiler is None:
+            return await self.get_response(request)
+
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            self.stop(profiler)
+        duration = time.perf_counter() - started
+
+        return await sync_to_async(self.store)(
+            request, response, profiler, trigger, duration
+        )
+
+    @staticmethod
+    def get_trigger(request):
+        if PROFILE_SAMPLE_RATE and random.random() < PROFILE_SAMPLE_RATE:
+            return PROFILE_TRIGGER_SAMPLED
+
+        token = request.META.get(PROFILE_HEADER)
+        if token is None:
+            return None
+
+        # Signed By manage.py profiletoken, Never Older Than PROFILE_TOKEN_MAX_AGE
+        data = decode_token(key=SECRET_KEY, token=token)
+        if not data or not data.get("profile") or not data.get("iat"):
+            return None
+        if time.time() - data["iat"] > PROFILE_TOKEN_MAX_AGE * 60:
+            return None
+
+        request._profile_user_id = data.get("user_id")
+        return PROFILE_TRIGGER_HEADER
+
+    @staticmethod
+    def is_staff_user(user_id):
+        from apps.authentication.models import User
+
+        # Re-Checked Per Request (Demoted Or Deactivated Staff Lose Access)
+        return (
+            User.objects.filter(pk=user_id, is_active=True)
+            .filter(Q(is_staff=True) | Q(is_superuser=True))
+            .exists()
+        )
+
+    @staticmethod
+    def start():
+        # cProfile Hooks Are Process-Wide On Python 3.12 (sys.monitoring):
+        # One Profile At A Time, Overlapping Requests Run Unprofiled
+        if not profile_lock.acquire(blocking=False):
+            return None
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another Profiling Tool Is Active (Debugger, Coverage)
+            profile_lock.release()
+            return None
+        return profiler
+
+    @staticmethod
+    def stop(profiler):
+        try:
+            profiler.disable()
+        finally:
+            profile_lock.release()
+
+    @staticmethod
+    def summarize(profiler):
+        stream = io.StringIO()
+        stats = pstats.Stats(profiler, stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILE_STATS_LIMIT)
+        return stream.getvalue()
+
+    def store(self, request, response, profiler, trigger, duration):
+        from manager.models import RequestProfile
+
+        resolver_match = getattr(request, "resolver_match", None)
+        try:
+            # Same Format As cProfile.dump_stats (Loadable By pstats/snakeviz)
+            profiler.create_stats()
+            profile = RequestProfile.objects.create(
+                user_id=getattr(request, "_profile_user_id", None),
+                method=request.method,
+                path=request.path[:1024],
+                view=resolver_match.view_name if resolver_match else None,
+                status_code=response.status_code,
+                duration_ms=round(duration * 1000, 2),
+                trigger=trigger,
+                summary=self.summarize(profiler),
+                file=ContentFile(
+                    marshal.dumps(profiler.stats),
+                    name="{}.pstats".format(uuid.uuid4().hex),
+                ),
+            )
+        except Exception as e:
+            # Never Fail The Request Because Of The Profiler
+            logger.warning(
+                {"message": "Request Profile Not Stored", "error": str(e)},
+                exc_info=True,
+            )
+            return response
+
+        if trigger == PROFILE_TRIGGER_HEADER:
+            response["X-Profile-Id"] = str(profile.pk)
+        return response
+
+
+class IPIdentificationMiddleware(BaseMiddleware):
     def process_request(self, request):
         remote_addr = request.META.get("REMOTE_ADDR")
         ip = remote_addr
@@ -30,7 +296,7 @@ class IPIdentificationMiddleware(MiddlewareMixin):
         request.ip = ip
 
 
-class IPBlockMiddleware(MiddlewareMixin):
+class IPBlockMiddleware(BaseMiddleware):
     def process_request(self, request):
         from django.conf import settings
 
@@ -42,59 +308,80 @@ class IPBlockMiddleware(MiddlewareMixin):
         return None
 
 
-class LoggingMiddleware(MiddlewareMixin):
+class LoggingMiddleware(BaseMiddleware):
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        install_on_open_connections()
+
     def process_request(self, request):
         request._start_time = time.time()
+        request._query_stats_token = start_query_stats()
+        request._timer_token = start_timer()
 
-        # Parse Body
-        body = request.body
-        if isinstance(body, bytes):
-            try:
-                body = body.decode("utf-8")
-                try:
-                    body = json.loads(body)
-                except json.decoder.JSONDecodeError:
-                    pass
-            except UnicodeDecodeError:
-                body = ""
-
-        request._parsed_body = body
+        # Keep Raw Body For Error Logs (Never Buffer Uploads Or Binary Payloads)
+        content_type = request.META.get("CONTENT_TYPE", "")
+        if content_type.startswith(LOG_BODY_SKIPPED_CONTENT_TYPES):
+            request._raw_body = None
+        else:
+            request._raw_body = request.body
 
     def process_response(self, request, response):
+        return self.log_response(request, response, getattr(request, "user", None))
+
+    async def aprocess_response(self, request, response):
+        # Lazy Session Users Hit The ORM; Resolve Them Off The Event Loop
+        user = getattr(request, "user", None)
+        if isinstance(user, SimpleLazyObject) and user._wrapped is empty:
+            user = await request.auser()
+        return self.log_response(request, response, user)
+
+    def log_response(self, request, response, user):
         duration = time.time() - request._start_time
+        status_code = response.status_code
+        query_stats = stop_query_stats(request._query_stats_token)
+        timer = stop_timer(request._timer_token)
+        self.check_query_budget(request, query_stats)
+
+        # Expose Phase Timings To Staff (And Everyone In DEBUG)
+        if settings.DEBUG or getattr(user, "is_staff", False):
+            response["Server-Timing"] = timer.server_timing()
+
+        # Sample Successful Responses
+        if status_code < 400 and not self.is_sampled(request.path, status_code):
+            return response
 
         # Set Level
-        if response.status_code >= 500:
+        if status_code >= 500:
             log_method = logger.error
-        elif response.status_code == 404:
+        elif status_code == 404:
             log_method = logger.warning
-        elif response.status_code >= 400:
+        elif status_code >= 400:
             log_method = logger.info
         else:
             log_method = logger.info
 
-        log_method(
-            {
-                "method": request.method,
-                "path": request.path,
-                "status_code": response.status_code,
-                "duration_ms": round(duration * 1000, 2),
-                "ip": request.ip,
-                "body": request._parsed_body,
-                "files": len(request.FILES),
-                "query_params": dict(request.GET),
-                "user": (
-                    getattr(request.user, "id", None)
-                    if hasattr(request, "user")
-                    else None
-                ),
-                "db_request_count": len(connection.queries),
-            }
-        )
+        details = {
+            "method": request.method,
+            "path": request.path,
+            "status_code": status_code,
+            "duration_ms": round(duration * 1000, 2),
+            "ip": request.ip,
+            "user": getattr(user, "id", None),
+            "db_request_count": query_stats.count,
+            "db": query_stats.summary(),
+            "timings": timer.summary(),
+        }
+
+        # Full Capture On Client/Server Errors Only
+        if status_code >= 400:
+            details.update(self.capture(request))
+
+        log_method(details)
 
         return response
 
     def process_exception(self, request, exception):
+        query_stats = current_query_stats.get()
         logger.error(
             {
                 "method": request.method,
@@ -102,40 +389,120 @@ class LoggingMiddleware(MiddlewareMixin):
                 "status_code": 500,
                 "duration_ms": None,
                 "ip": request.ip,
-                "body": request._parsed_body,
-                "files": len(request.FILES),
-                "query_params": dict(request.GET),
                 "user": (
                     getattr(request.user, "id", None)
                     if hasattr(request, "user")
                     else None
                 ),
-                "db_request_count": len(connection.queries),
+                "db": query_stats.summary() if query_stats else None,
+                **self.capture(request),
             },
             exc_info=True,
         )
 
         return None
 
+    @staticmethod
+    def check_query_budget(request, query_stats):
+        view_class = getattr(
+            getattr(request, "resolver_match", None) and request.resolver_match.func,
+            "cls",
+            None,
+        )
+        budget = getattr(view_class, "query_budget", None)
+        if budget is None:
+            budget = QUERY_BUDGET_DEFAULT
+        if query_stats.count <= budget:
+            return
+
+        logger.warning(
+            {
+                "message": "Query Budget Exceeded",
+                "method": request.method,
+                "path": request.path,
+                "view": view_class.__name__ if view_class else None,
+                "budget": budget,
+                **query_stats.summary(),
+            }
+        )
+
+    @staticmethod
+    def is_sampled(path, status_code):
+        rate = LOG_STATUS_SAMPLE_RATES.get(status_code)
+        if rate is None:
+            # Longest Matching Path Prefix Wins
+            prefixes = [p for p in LOG_PATH_SAMPLE_RATES if path.startswith(p)]
+            rate = (
+                LOG_PATH_SAMPLE_RATES[max(prefixes, key=len)]
+                if prefixes
+                else LOG_SUCCESS_SAMPLE_RATE
+            )
+        return rate >= 1 or random.random() < rate
+
+    @staticmethod
+    def parse_body(request):
+        raw_body = getattr(request, "_raw_body", None)
+        if raw_body is None:
+            content_type = request.META.get("CONTENT_TYPE", "")
+            if content_type.startswith("multipart/"):
+                # Form Fields Only (Already Parsed By The View)
+                return dict(request.POST)
+            if not request.META.get("CONTENT_LENGTH"):
+                return ""
+            return "<{}: {} bytes>".format(
+                content_type.split(";")[0], request.META["CONTENT_LENGTH"]
+            )
 
-class MediaMiddleware(MiddlewareMixin):
+        # Truncate Large Bodies (Logged As Text)
+        if len(raw_body) > LOG_BODY_MAX_BYTES:
+            return "{}... <truncated {} bytes>".format(
+                raw_body[:LOG_BODY_MAX_BYTES].decode("utf-8", errors="ignore"),
+                len(raw_body) - LOG_BODY_MAX_BYTES,
+            )
+
+        try:
+            body = raw_body.decode("utf-8")
+        except UnicodeDecodeError:
+            return ""
+        try:
+            return json.loads(body)
+        except json.decoder.JSONDecodeError:
+            return body
+
+    def capture(self, request):
+        return {
+            "body": self.parse_body(request),
+            "files": len(request.FILES),
+            "query_params": dict(request.GET),
+        }
+
+
+class MediaMiddleware(BaseMiddleware):
     def process_request(self, request):
         if request.path.startswith(MEDIA_URL):
-            # Check Private Access
-            if request.path.startswith("{}admin/".format(MEDIA_URL)):
-                user = request.user
-                if not user.is_authenticated or not (
-                    user.is_staff or user.is_superuser
-                ):
-                    raise Http404
-
-            # Serve Files
-            file_path = os.path.join(
-                settings.MEDIA_ROOT, request.path[len(MEDIA_URL) :]
-            )
-            if not os.path.exists(file_path):
+            # Check Private Access On The Resolved Path
+            path = media_path(request.path[len(MEDIA_URL) :])
+            private = is_private_media(path)
+            if private and not self.is_staff(request.user):
                 raise Http404
+            return serve_media(request, path, private)
 
-            return FileResponse(open(file_path, "rb"))
+        return None
+
+    async def aprocess_request(self, request):
+        if request.path.startswith(MEDIA_URL):
+            # Check Private Access (Resolve User Without Blocking The Loop)
+            path = media_path(request.path[len(MEDIA_URL) :])
+            private = is_private_media(path)
+            if private and not self.is_staff(await request.auser()):
+                raise Http404
+            # open/fstat Block; Keep Them Off The Event Loop
+            return await sync_to_async(serve_media, thread_sensitive=False)(
+                request, path, private
+            )
 
         return None
+
+    @staticmethod
+    def is_staff(user) -> bool:
+        return user.is_authenticated and (user.is_staff or user.is_superuser)
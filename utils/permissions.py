@@ -1,12 +1,14 @@
+import hmac
 from typing import Optional, Tuple, List
 
-from project_title.settings import SECRET_KEY
+from project_title.settings import METRICS_TOKEN, SECRET_KEY
 from rest_framework import permissions, status
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.exceptions import APIException
 
 from apps.authentication.models import User
 from tools.security import decode_token
+from tools.timing import phase
 from utils.session import Session
 
 
@@ -34,6 +36,16 @@ class IsAuthenticated(permissions.BasePermission):
         raise AuthenticationError("Authentication Error!")
 
 
+class MetricsPermission(permissions.BasePermission):
+    def has_permission(self, request, view) -> bool:
+        token: str = request.META.get("HTTP_AUTHORIZATION", "")
+        if METRICS_TOKEN and hmac.compare_digest(
+            token.encode("utf-8"), "Bearer {}".format(METRICS_TOKEN).encode("utf-8")
+        ):
+            return True
+        raise AccessError("Access Denied")
+
+
 class FeaturePermission(ArgsPermission):
     def __init__(self, *features: str) -> None:
         self.features: Tuple[str, ...] = features
@@ -94,20 +106,21 @@ class TemporaryLinkAuthentication(BaseAuthentication):
 
 
 class TokenAuthentication(BaseAuthentication):
-    def authenticate(self, request) -> Optional[Tuple[User, str]]:
+    @staticmethod
+    def get_token(request) -> Optional[str]:
         token: Optional[str] = request.META.get("HTTP_AUTHORIZATION")
         if not (token and token.startswith("Bearer ")):
             return None
+        return token[7:]  # Remove "Bearer " Prefix
 
-        token = token[7:]  # Remove "Bearer " Prefix
-
-        # Validate Session
-        session: Optional[Session] = Session(token=token).initialize()
+    @staticmethod
+    def check_session(session: Optional[Session]) -> Session:
         if not (session and session.is_accessable):
             raise AuthenticationError("Invalid Token")
+        return session
 
-        # Authenticate User
-        user: Optional[User] = session.get_user()
+    @staticmethod
+    def login(request, session: Session, user: Optional[User]) -> User:
         if not user:
             raise AuthenticationError("Invalid User Token")
         if not user.is_active:
@@ -115,7 +128,38 @@ class TokenAuthentication(BaseAuthentication):
 
         request.user = user
         request.session = session
+        return user
+
+    def authenticate(self, request) -> Optional[Tuple[User, str]]:
+        token: Optional[str] = self.get_token(request)
+        if not token:
+            return None
+
+        # Validate Session
+        with phase("auth-session"):
+            session: Session = self.check_session(Session(token=token).initialize())
+
+        # Authenticate User
+        with phase("auth-user"):
+            user: User = self.login(request, session, session.get_user())
 
         # Auto-Refresh Session Expiration
-        session.refresh()
+        with phase("auth-refresh"):
+            session.refresh()
+        return user, session.token
+
+    async def aauthenticate(self, request) -> Optional[Tuple[User, str]]:
+        # Same Flow As authenticate() Without Blocking The Event Loop
+        token: Optional[str] = self.get_token(request)
+        if not token:
+            return None
+
+        with phase("auth-session"):
+            session: Session = self.check_session(
+                await Session(token=token).ainitialize()
+            )
+        with phase("auth-user"):
+            user: User = self.login(request, session, await session.aget_user())
+        with phase("auth-refresh"):
+            await session.arefresh()
         return user, session.token
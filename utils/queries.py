@@ -0,0 +1,97 @@
+import time
+from collections import Counter
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Dict, Optional
+
+from django.db import connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+from CONSTANTS import QUERY_LOG_DUPLICATES_TOP, QUERY_LOG_SQL_MAX_LENGTH
+
+
+class QueryStats:
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.time_ms: float = 0.0
+        self.slowest_ms: float = 0.0
+        self.slowest_sql: Optional[str] = None
+        self.statements: Counter = Counter()
+
+    def record(self, sql: str, duration_ms: float) -> None:
+        self.count += 1
+        self.time_ms += duration_ms
+        # Parameterized SQL Is Its Own Fingerprint (Same Statement, Other Params)
+        self.statements[sql] += 1
+        if duration_ms > self.slowest_ms:
+            self.slowest_ms = duration_ms
+            self.slowest_sql = sql
+
+    @property
+    def duplicates(self) -> Dict[str, int]:
+        return {
+            sql[:QUERY_LOG_SQL_MAX_LENGTH]: count
+            for sql, count in self.statements.most_common(QUERY_LOG_DUPLICATES_TOP)
+            if count > 1
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "time_ms": round(self.time_ms, 2),
+            "slowest_ms": round(self.slowest_ms, 2),
+            "slowest_sql": (
+                self.slowest_sql[:QUERY_LOG_SQL_MAX_LENGTH]
+                if self.slowest_sql
+                else None
+            ),
+            "duplicates": self.duplicates,
+        }
+
+
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+def start_query_stats() -> Token:
+    return current_query_stats.set(QueryStats())
+
+
+def stop_query_stats(token: Token) -> Optional[QueryStats]:
+    stats: Optional[QueryStats] = current_query_stats.get()
+    current_query_stats.reset(token)
+    return stats
+
+
+def query_collector(
+    execute: Callable, sql: str, params: Any, many: bool, context: Dict[str, Any]
+) -> Any:
+    stats: Optional[QueryStats] = current_query_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+
+    started: float = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.record(sql, (time.perf_counter() - started) * 1000)
+
+
+def install_query_collector(connection: BaseDatabaseWrapper) -> None:
+    if query_collector not in connection.execute_wrappers:
+        connection.execute_wrappers.append(query_collector)
+
+
+@receiver(connection_created)
+def on_connection_created(
+    sender: Any, connection: BaseDatabaseWrapper, **kwargs: Any
+) -> None:
+    install_query_collector(connection)
+
+
+def install_on_open_connections() -> None:
+    # Connections Opened Before This Module Was Imported
+    for connection in connections.all(initialized_only=True):
+        install_query_collector(connection)
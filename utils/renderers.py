@@ -0,0 +1,16 @@
+from typing import Any, Optional
+
+from rest_framework.renderers import JSONRenderer
+
+from tools.timing import phase
+
+
+class TimedJSONRenderer(JSONRenderer):
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: Optional[str] = None,
+        renderer_context: Optional[dict] = None,
+    ) -> bytes:
+        with phase("render"):
+            return super().render(data, accepted_media_type, renderer_context)
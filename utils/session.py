@@ -1,20 +1,164 @@
 import secrets
-from typing import Optional, Generator
+from itertools import islice
+from typing import Optional, Generator, List, Tuple, Any
 
-from django.core.exceptions import ObjectDoesNotExist
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Field as ModelField
 from pydantic import BaseModel, Field, PrivateAttr
 
 from CONSTANTS import (
+    REDIS_BATCH_SIZE,
     USER_SESSION_KEY_PREFIX,
     USER_SESSION_FULL_AGE,
     USER_SESSION_RENEWAL_AGE,
+    USER_SESSION_REFRESH_THRESHOLD,
+    USER_SNAPSHOT_KEY_PREFIX,
+    USER_SNAPSHOT_GENERATION_PREFIX,
+    USER_SNAPSHOT_CACHE_AGE,
+    USER_SNAPSHOT_LOCAL_CACHE_AGE,
+    USER_SNAPSHOT_LOCAL_CACHE_SIZE,
+    USER_SNAPSHOT_VERSION,
 )
 from apps.authentication.models import User
-from services.redis import redis_client
+from services.metrics import observe_user_cache
+from services.redis import redis_client, async_redis_client
+from tools.cache import TTLCache, Counters
 from tools.datetimes import dt
 
 SESSION_FULL_AGE: int = USER_SESSION_FULL_AGE
 SESSION_RENEWAL_AGE: int = USER_SESSION_RENEWAL_AGE
+SESSION_REFRESH_THRESHOLD: int = USER_SESSION_REFRESH_THRESHOLD
+
+# Sensitive Fields Never Leave The Database (Loaded Lazily On Access)
+SNAPSHOT_EXCLUDED_FIELDS: Tuple[str, ...] = ("password",)
+
+user_cache: TTLCache = TTLCache(
+    max_size=USER_SNAPSHOT_LOCAL_CACHE_SIZE, ttl=USER_SNAPSHOT_LOCAL_CACHE_AGE
+)
+user_cache_stats: Counters = Counters(
+    "local_hit", "redis_hit", "miss", "invalidation", on_incr=observe_user_cache
+)
+
+
+def _snapshot_fields() -> List[ModelField]:
+    return [
+        f
+        for f in User._meta.concrete_fields
+        if f.attname not in SNAPSHOT_EXCLUDED_FIELDS
+    ]
+
+
+def _snapshot_key(user_id: int) -> str:
+    return "{}{}".format(USER_SNAPSHOT_KEY_PREFIX, user_id)
+
+
+def _generation_key(user_id: int) -> str:
+    # Bumped On Every Invalidation; Snapshots Built Before A Bump Are Not Written
+    return "{}{}".format(USER_SNAPSHOT_GENERATION_PREFIX, user_id)
+
+
+def dump_user_snapshot(user: User) -> dict:
+    return {
+        "version": USER_SNAPSHOT_VERSION,
+        "fields": {f.attname: getattr(user, f.attname) for f in _snapshot_fields()},
+    }
+
+
+def load_user_snapshot(snapshot: dict) -> Optional[List[Any]]:
+    if snapshot.get("version") != USER_SNAPSHOT_VERSION:
+        return None
+
+    fields: dict = snapshot.get("fields", {})
+    try:
+        return [f.to_python(fields[f.attname]) for f in _snapshot_fields()]
+    except (KeyError, ValueError):
+        return None
+
+
+def build_user(values: List[Any]) -> User:
+    field_names: List[str] = [f.attname for f in _snapshot_fields()]
+    return User.from_db(DEFAULT_DB_ALIAS, field_names, values)
+
+
+def _local_user(user_id: int) -> Optional[User]:
+    values: Optional[List[Any]] = user_cache.get(user_id)
+    if values is None:
+        return None
+    user_cache_stats.incr("local_hit")
+    return build_user(values)
+
+
+def _snapshot_user(user_id: int, snapshot: Optional[dict]) -> Optional[User]:
+    values: Optional[List[Any]] = load_user_snapshot(snapshot) if snapshot else None
+    if values is None:
+        return None
+    user_cache_stats.incr("redis_hit")
+    user_cache.set(user_id, values)
+    return build_user(values)
+
+
+def _remember_user(user: User) -> dict:
+    # Local Copy Now; The Returned Snapshot Is Written To Redis By The Caller
+    user_cache.set(user.pk, [getattr(user, f.attname) for f in _snapshot_fields()])
+    return dump_user_snapshot(user)
+
+
+def get_cached_user(user_id: int) -> Optional[User]:
+    # In-Process Cache, Then Redis Snapshot
+    user: Optional[User] = _local_user(user_id) or _snapshot_user(
+        user_id, redis_client.get_json(_snapshot_key(user_id))
+    )
+    if user:
+        return user
+
+    # Database (Generation Read First: A Save Racing This Read Skips The Write)
+    user_cache_stats.incr("miss")
+    generation: int = redis_client.get_counter(_generation_key(user_id))
+    user = User.objects.filter(id=user_id).first()
+    if not user:
+        return None
+
+    redis_client.set_json_if_counter(
+        key=_snapshot_key(user_id),
+        value=_remember_user(user),
+        counter_key=_generation_key(user_id),
+        counter=generation,
+        expire=USER_SNAPSHOT_CACHE_AGE,
+    )
+    return user
+
+
+async def aget_cached_user(user_id: int) -> Optional[User]:
+    # Same Lookup Order As get_cached_user
+    user: Optional[User] = _local_user(user_id) or _snapshot_user(
+        user_id, await async_redis_client.get_json(_snapshot_key(user_id))
+    )
+    if user:
+        return user
+
+    user_cache_stats.incr("miss")
+    generation: int = await async_redis_client.get_counter(_generation_key(user_id))
+    user = await User.objects.filter(id=user_id).afirst()
+    if not user:
+        return None
+
+    await async_redis_client.set_json_if_counter(
+        key=_snapshot_key(user_id),
+        value=_remember_user(user),
+        counter_key=_generation_key(user_id),
+        counter=generation,
+        expire=USER_SNAPSHOT_CACHE_AGE,
+    )
+    return user
+
+
+def invalidate_user_cache(user_id: int) -> None:
+    user_cache.delete(user_id)
+    redis_client.incr_with_ttl(
+        _generation_key(user_id), expire=USER_SNAPSHOT_CACHE_AGE, sliding=True
+    )
+    redis_client.delete(key=_snapshot_key(user_id))
+    user_cache_stats.incr("invalidation")
 
 
 class ConflictTokenError(Exception):
@@ -31,27 +175,44 @@ class Session(BaseModel):
         ).timestamp()
     )
     _user_obj: Optional[User] = PrivateAttr(default=None)
+    _ttl: Optional[int] = PrivateAttr(default=None)
+    _dirty: bool = PrivateAttr(default=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._dirty = True
 
     @property
     def full_token(self) -> str:
         return USER_SESSION_KEY_PREFIX + self.token
 
-    def initialize(self) -> Optional["Session"]:
-        session: Optional[dict] = redis_client.get_json(self.full_token)
+    def _load(self, session: Optional[dict], ttl: Optional[int]) -> Optional["Session"]:
         if session:
             self.user_id = session["user_id"]
             self.content = session["content"]
             self.expired = session["expired"]
+            self._ttl = ttl
+            self._dirty = False
             return self
         return None
 
+    def initialize(self) -> Optional["Session"]:
+        return self._load(*redis_client.get_json_with_ttl(self.full_token))
+
+    async def ainitialize(self) -> Optional["Session"]:
+        return self._load(*await async_redis_client.get_json_with_ttl(self.full_token))
+
     def create(self) -> "Session":
         created: Optional[Session] = self.initialize()
         if not created:
-            redis_client.set_json(
-                key=self.full_token, value=self.model_dump(), expire=SESSION_RENEWAL_AGE
-            )
-            return self
+            return self.update()
+        raise ConflictTokenError("TOKEN: {}".format(self.token))
+
+    async def acreate(self) -> "Session":
+        created: Optional[Session] = await self.ainitialize()
+        if not created:
+            return await self.aupdate()
         raise ConflictTokenError("TOKEN: {}".format(self.token))
 
     @property
@@ -59,35 +220,82 @@ class Session(BaseModel):
         return bool(self.user_id and self.expired > dt.datetime.now().timestamp())
 
     def get_user(self) -> Optional[User]:
-        try:
-            user: User = User.objects.get(id=self.user_id)
+        if not self.user_id:
+            return None
+
+        user: Optional[User] = get_cached_user(self.user_id)
+        if user:
             self._user_obj = user
-            return user
-        except ObjectDoesNotExist:
+        return user
+
+    async def aget_user(self) -> Optional[User]:
+        if not self.user_id:
             return None
 
+        user: Optional[User] = await aget_cached_user(self.user_id)
+        if user:
+            self._user_obj = user
+        return user
+
     def update(self) -> "Session":
         redis_client.set_json(
-            key=self.full_token, value=self.model_dump(), expire=SESSION_RENEWAL_AGE
+            key=self.full_token,
+            value=self.model_dump(),
+            expire=SESSION_RENEWAL_AGE,
+            use_dictionary=True,
         )
+        self._ttl = SESSION_RENEWAL_AGE
+        self._dirty = False
         return self
 
-    def clear(self) -> "Session":
-        self.content = {}
-        redis_client.set_json(
-            key=self.full_token, value=self.model_dump(), expire=SESSION_RENEWAL_AGE
+    async def aupdate(self) -> "Session":
+        await async_redis_client.set_json(
+            key=self.full_token,
+            value=self.model_dump(),
+            expire=SESSION_RENEWAL_AGE,
+            use_dictionary=True,
         )
+        self._ttl = SESSION_RENEWAL_AGE
+        self._dirty = False
         return self
 
+    def clear(self) -> "Session":
+        self.content = {}
+        return self.update()
+
+    async def aclear(self) -> "Session":
+        self.content = {}
+        return await self.aupdate()
+
     def refresh(self) -> "Session":
-        redis_client.set_json(
-            key=self.full_token, value=self.model_dump(), expire=SESSION_RENEWAL_AGE
-        )
+        # Rewrite Payload Only When Changed
+        if self._dirty:
+            return self.update()
+
+        # Extend Expiration Only When Close To Renewal Age
+        if self._ttl is not None and self._ttl >= SESSION_REFRESH_THRESHOLD:
+            return self
+
+        redis_client.expire(key=self.full_token, expire=SESSION_RENEWAL_AGE)
+        self._ttl = SESSION_RENEWAL_AGE
+        return self
+
+    async def arefresh(self) -> "Session":
+        if self._dirty:
+            return await self.aupdate()
+        if self._ttl is not None and self._ttl >= SESSION_REFRESH_THRESHOLD:
+            return self
+
+        await async_redis_client.expire(key=self.full_token, expire=SESSION_RENEWAL_AGE)
+        self._ttl = SESSION_RENEWAL_AGE
         return self
 
     def flush(self) -> None:
         redis_client.delete(key=self.full_token)
 
+    async def aflush(self) -> None:
+        await async_redis_client.delete(key=self.full_token)
+
 
 def get_all_sessions() -> Generator[Session, None, None]:
     redis_keys: Generator = redis_client.get_keys_by_prefix(
@@ -95,13 +303,33 @@ def get_all_sessions() -> Generator[Session, None, None]:
     )
 
     for key in redis_keys:
-        session_token: str = key.decode("utf-8")[len(USER_SESSION_KEY_PREFIX):]
+        session_token: str = key.decode("utf-8")[len(USER_SESSION_KEY_PREFIX) :]
         session: Session = Session(token=session_token)
         yield session
 
 
 def get_healthy_sessions() -> Generator[Session, None, None]:
-    for s in get_all_sessions():
-        session: Optional[Session] = s.initialize()
-        if session and session.is_accessable and session.get_user():
-            yield session
+    redis_keys: Generator = redis_client.get_keys_by_prefix(
+        prefix=USER_SESSION_KEY_PREFIX
+    )
+
+    # Load Sessions In Batches (One Round Trip Per Batch)
+    while True:
+        keys: List[str] = [
+            k.decode("utf-8") for k in islice(redis_keys, REDIS_BATCH_SIZE)
+        ]
+        if not keys:
+            break
+
+        for key, payload in zip(keys, redis_client.mget_json(keys)):
+            if not payload:
+                continue
+
+            session: Session = Session(
+                token=key[len(USER_SESSION_KEY_PREFIX) :],
+                user_id=payload["user_id"],
+                content=payload["content"],
+                expired=payload["expired"],
+            )
+            if session.is_accessable and session.get_user():
+                yield session
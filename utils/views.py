@@ -3,6 +3,8 @@ from typing import Any, Optional
 from django.http import JsonResponse
 from rest_framework.views import APIView
 
+from tools.timing import current_timer, phase
+
 
 class HTTPError(Exception):
     def __init__(self, message: Optional[str] = None, status_code: int = 400, data: Optional[dict] = None):
@@ -38,9 +40,39 @@ def get_object_or_error(status_code: int, message: Optional[str], klass: Any, *a
 
 
 class BaseView(APIView):
+    query_budget: Optional[int] = None  # Max DB Queries Per Request (None: Default)
+
     def dispatch(self, request: Any, *args: Any, **kwargs: Any) -> Any:
         try:
             response = super().dispatch(request, *args, **kwargs)
             return response
         except HTTPError as exc:
             return JsonResponse(data=exc.data, status=exc.status_code)
+
+    # Per-Phase Timings (Server-Timing Header And Request Log)
+
+    def perform_authentication(self, request: Any) -> None:
+        with phase("auth"):
+            super().perform_authentication(request)
+
+    def check_permissions(self, request: Any) -> None:
+        with phase("permissions"):
+            super().check_permissions(request)
+
+    def check_throttles(self, request: Any) -> None:
+        with phase("throttle"):
+            super().check_throttles(request)
+
+    def initial(self, request: Any, *args: Any, **kwargs: Any) -> None:
+        super().initial(request, *args, **kwargs)
+        timer = current_timer.get()
+        if timer:
+            timer.start("view")
+
+    def finalize_response(
+        self, request: Any, response: Any, *args: Any, **kwargs: Any
+    ) -> Any:
+        timer = current_timer.get()
+        if timer:
+            timer.stop("view")
+        return super().finalize_response(request, response, *args, **kwargs)